@@ -0,0 +1,138 @@
+from lstore.db import Database
+from lstore.query import Query
+from lstore import config
+
+from random import randint, seed
+import shutil
+
+# Exercises the batch table APIs (Table.insert_rows, Table.update_rows) against
+# the per-record query path, including the all-or-nothing rejection of a bad batch.
+shutil.rmtree('./CS451_bulk', ignore_errors=True)
+
+db = Database()
+db.open('./CS451_bulk')
+grades_table = db.create_table('Grades', 5, 0)
+query = Query(grades_table)
+
+records = {}
+
+number_of_records = 1000
+
+seed(3562901)
+
+for i in range(0, number_of_records):
+    key = 92106429 + i
+    records[key] = [key, randint(0, 20), randint(0, 20), randint(0, 20), randint(0, 20)]
+keys = sorted(list(records.keys()))
+
+# numeric strings / floats are coerced like Query.insert does
+rows = [records[key] if i % 7 else [str(v) for v in records[key]] for i, key in enumerate(keys)]
+if not grades_table.insert_rows(rows):
+    print('insert_rows error: batch rejected')
+print("Bulk insert finished")
+
+
+def check_all(label):
+    for key in keys:
+        result = query.select(key, 0, [1, 1, 1, 1, 1])
+        if not result or result[0].columns != records[key]:
+            print(label, 'error on', key, ':', result[0].columns if result else None, ', correct:', records[key])
+
+
+check_all('select')
+print("Select finished")
+
+# rejected batches: nothing may be written, counters and pins must not move
+count = grades_table.base_record_count
+bad_batches = [
+    [[1, 1, 1, 1, 1], [2, "x", 1, 1, 1]],      # not int-convertible
+    [[3, 1, 1, 1, 1], [4, 1, 1, 1, 2 ** 63]],  # outside int64
+    [[5, 1, 1, 1, 1], [5, 2, 2, 2, 2]],        # duplicate PK in batch
+    [[6, 1, 1, 1, 1], [keys[0], 2, 2, 2, 2]],  # duplicate PK in table
+    [[7, 1, 1, 1]],                            # wrong width
+]
+for batch in bad_batches:
+    if grades_table.insert_rows(batch) is not False:
+        print('insert_rows error: accepted bad batch', batch)
+if grades_table.base_record_count != count:
+    print('insert_rows error: rejected batch moved base_record_count')
+if any(frame.is_pinned for frame in db.bufferpool.pages.values()):
+    print('insert_rows error: rejected batch left pages pinned')
+for key in (1, 3, 5, 6, 7):
+    if query.select(key, 0, [1, 1, 1, 1, 1]):
+        print('insert_rows error: rejected batch left row', key)
+print("Rejection finished")
+
+# batched updates: two per row in one call, so each row chains two new tails
+# and the older one must still be readable as version -1
+previous = {}
+updates = []
+for n, key in enumerate(keys):
+    rid = query._pk_to_rid(key)
+    for _ in range(2):
+        updated_columns = [None, None, None, None, None]
+        for i in range(3, grades_table.num_columns):
+            if randint(0, 1):
+                updated_columns[i] = randint(0, 20)
+        # column 2 always changes, so every update appends a tail
+        updated_columns[2] = (records[key][2] + 1) % 21
+        previous[key] = records[key].copy()
+        for i, value in enumerate(updated_columns):
+            if value is not None:
+                records[key][i] = value
+        if n % 5 == 0:
+            updated_columns = [None if v is None else str(v) for v in updated_columns]
+        updates.append((rid, updated_columns))
+if not grades_table.update_rows(updates):
+    print('update_rows error: batch rejected')
+check_all('update_rows select')
+for key in keys:
+    result = query.select_version(key, 0, [1, 1, 1, 1, 1], -1)
+    if not result or result[0].columns != previous[key]:
+        print('update_rows version error on', key, ':', result[0].columns if result else None, ', correct:', previous[key])
+print("Bulk update finished")
+
+rid = query._pk_to_rid(keys[0])
+# a row that exists in the directory but is deleted
+query.insert(1, 1, 1, 1, 1)
+deleted_rid = query._pk_to_rid(1)
+query.delete(1)
+count = grades_table.tail_record_count
+bad_batches = [
+    [(rid, [None, None, 1, None, None]), (rid, [None, "x", None, None, None])],  # not int-convertible
+    [(rid, [None, None, 1, None, None]), (rid, [None, 2 ** 63, None, None, None])],  # outside int64
+    [(rid, [None, None, 1, None])],                                            # wrong width
+    [(rid, [None, None, 1, None, None]), (10 ** 8, [None, 1, None, None, None])],  # unknown RID
+    [("y", [None, None, 1, None, None])],                                      # RID not an int
+    [(rid,)],                                                                  # malformed entry
+    [(config.TAIL_RID_START + 1, [None, 11, None, None, None])],              # tail RID
+    [(deleted_rid, [None, 11, None, None, None])],                             # deleted row
+]
+for batch in bad_batches:
+    if grades_table.update_rows(batch) is not False:
+        print('update_rows error: accepted bad batch', batch)
+for bad_rid in (config.TAIL_RID_START + 1, deleted_rid):
+    if grades_table.update_row(bad_rid, None, 11, None, None, None) is not False:
+        print('update_row error: accepted non-live base RID', bad_rid)
+if grades_table.tail_record_count != count:
+    print('update_rows error: rejected batch moved tail_record_count')
+if any(frame.is_pinned for frame in db.bufferpool.pages.values()):
+    print('update_rows error: rejected batch left pages pinned')
+check_all('update_rows rejection select')
+print("Update rejection finished")
+
+column_sum = sum(records[key][1] for key in keys)
+result = query.sum(keys[0], keys[-1], 1)
+if column_sum != result:
+    print('sum error: ', result, ', correct: ', column_sum)
+print("Aggregate finished")
+db.close()
+
+# everything above must survive a reopen
+db = Database()
+db.open('./CS451_bulk')
+grades_table = db.get_table('Grades')
+query = Query(grades_table)
+check_all('reopen select')
+print("Reopen finished")
+db.close()
@@ -47,6 +47,9 @@ False
 ['a', 'c', 'd']
 """
 
+import array
+import bisect
+import collections
 import json
 
 class BPlusTreeNode:
@@ -56,30 +59,59 @@ class BPlusTreeNode:
 
     Attributes:
         is_leaf (bool): True if this is a leaf node, False if internal
-        keys (list): List of keys stored in this node
+        keys (list|array.array): Sorted keys stored in this node; a packed
+            array('q') when the tree was built with int_keys=True
         values (list): List of values (only used in leaf nodes)
         children (list): List of child node pointers (only used in internal nodes)
         next (BPlusTreeNode): Link to next leaf node (only used in leaf nodes)
+        parent (BPlusTreeNode): Link to the parent internal node (None for the root)
+        _cached_dict (dict): Memoized to_dict() form of this subtree; None when dirty
     """
-    def __init__(self, is_leaf=False):
+    __slots__ = ("is_leaf", "keys", "values", "children", "next", "parent", "_cached_dict")
+
+    def __init__(self, is_leaf=False, int_keys=False):
         self.is_leaf = is_leaf
-        self.keys = []
+        self.keys = array.array('q') if int_keys else []
         self.values = []      # for leaf nodes
         self.children = []    # for internal nodes
         self.next = None      # link to next leaf
+        self.parent = None    # link to parent (not serialized)
+        self._cached_dict = None
 
 
 class BPlusTree:
-    def __init__(self, order=4):
+    def __init__(self, order=128, int_keys=False, page_size_hint=None):
         """
         Initialize an empty B+ tree.
         
         Args:
             order (int): The order of the B+ tree. Determines the maximum number of children
-                        per node and key-value pairs per leaf. Default is 4.
+                        per node and key-value pairs per leaf. Default is 128, so a descent
+                        touches few, wide nodes instead of many 3-key ones.
+            int_keys (bool): Store node keys in packed array('q') buffers instead of lists.
+                        Only valid when every key is a 64-bit integer (e.g. RIDs, PK values).
+            page_size_hint (int|None): If given, size nodes to a block of this many bytes
+                        (~16 bytes per key/pointer pair) instead of using `order`.
+
+        >>> t = BPlusTree(order=4, int_keys=True)
+        >>> all(t.insert(k, str(k)) for k in (5, 1, 3, 9, 7))
+        True
+        >>> t.root.keys.typecode, t.range_search(2, 7)
+        ('q', [(3, '3'), (5, '5'), (7, '7')])
         """
-        self.root = BPlusTreeNode(is_leaf=True)
+        if page_size_hint is not None:
+            order = max(8, int(page_size_hint) // 16)
+        self.int_keys = int_keys
+        self.root = BPlusTreeNode(is_leaf=True, int_keys=int_keys)
         self.order = order
+        self._max_keys = order - 1            # split above this many keys
+        self._min_keys = (order - 1) // 2     # rebalance below this many keys
+        # Splits keep the left half and merges fold right into left, so this only
+        # changes if a merge ever removes it (guarded in _merge_nodes).
+        self._leftmost_leaf = self.root
+        # (first_key, last_key, leaf) for recently visited leaves; any key within a
+        # leaf's observed key span must live in that leaf until the structure changes.
+        self._leaf_cache = collections.deque(maxlen=4)
 
     def search(self, key):
         """
@@ -92,9 +124,9 @@ class BPlusTree:
             The value associated with the key if found, None otherwise
         """
         leaf = self._find_leaf(key)
-        for atIndex, k in enumerate(leaf.keys):
-            if k == key:
-                return leaf.values[atIndex]
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
         return None #Key does not exist
 
 
@@ -112,19 +144,17 @@ class BPlusTree:
         leaf = self._find_leaf(key)
 
         # Check if key already exists
-        for k in leaf.keys:
-            if k == key:
-                return False  # Key already exists
-            
+        insert_index = bisect.bisect_left(leaf.keys, key)
+        if insert_index < len(leaf.keys) and leaf.keys[insert_index] == key:
+            return False  # Key already exists
+
         # Insert key-value pair into leaf node
-        insert_index = 0
-        while insert_index < len(leaf.keys) and leaf.keys[insert_index] < key:
-            insert_index += 1
         leaf.keys.insert(insert_index, key)
         leaf.values.insert(insert_index, value)
+        self._invalidate(leaf)
 
         # Check for overflow and split if necessary
-        if len(leaf.keys) > self.order - 1:
+        if len(leaf.keys) > self._max_keys:
             self._split_leaf(leaf)
         return True
 
@@ -139,16 +169,17 @@ class BPlusTree:
             True if the key was found and deleted, False otherwise
         """
         leaf = self._find_leaf(key)
-        if key not in leaf.keys:
+        index = bisect.bisect_left(leaf.keys, key)
+        if index >= len(leaf.keys) or leaf.keys[index] != key:
             return False  # Key not found
 
         # Remove key-value pair from leaf node
-        index = leaf.keys.index(key)
         leaf.keys.pop(index)
         leaf.values.pop(index)
+        self._invalidate(leaf)
 
         # Check for underflow and merge if necessary
-        if len(leaf.keys) < (self.order - 1) // 2:
+        if len(leaf.keys) < self._min_keys:
             self._merge_nodes(leaf)
 
         return True
@@ -185,10 +216,10 @@ class BPlusTree:
         False
         """
         leaf = self._find_leaf(key)
-        if key not in leaf.keys:
+        index = bisect.bisect_left(leaf.keys, key)
+        if index >= len(leaf.keys) or leaf.keys[index] != key:
             return False  # Key not found
 
-        index = leaf.keys.index(key)
         if mode == 'change':
             leaf.values[index] = new_value
         elif mode == 'append':
@@ -199,6 +230,7 @@ class BPlusTree:
         else:
             return False  # Invalid mode
 
+        self._invalidate(leaf)
         return True
 
     def range_search(self, start_key, end_key):
@@ -212,17 +244,19 @@ class BPlusTree:
         Returns:
             List of (key, value) tuples within the specified range
         """
-        # Find starting leaf
+        # Find starting leaf and jump to the first in-range slot
         results = []
         leaf = self._find_leaf(start_key)
+        j = bisect.bisect_left(leaf.keys, start_key)
         # Iterate leaf nodes until keys exceed end_key
         while leaf:
-            for k, v in zip(leaf.keys, leaf.values):
-                if k < start_key:
-                    continue
-                if k > end_key:
-                    return results
-                results.append((k, v))
+            keys = leaf.keys
+            if keys and keys[-1] > end_key:
+                cut = bisect.bisect_right(keys, end_key)
+                results.extend(zip(keys[j:cut], leaf.values[j:cut]))
+                return results
+            results.extend(zip(keys[j:], leaf.values[j:]))
+            j = 0
             leaf = leaf.next
         return results
 
@@ -236,39 +270,30 @@ class BPlusTree:
         Returns:
             The leaf node where the key should be located
         """
+        for lo, hi, leaf in self._leaf_cache:
+            if lo <= key <= hi:
+                return leaf
+
+        # Bind the C-level bisect once; the descent loop is pure interpreter overhead otherwise
+        bisect_right = bisect.bisect_right
         curr = self.root
         while not curr.is_leaf:
-            i = 0
-            while i < len(curr.keys) and key >= curr.keys[i]:
-                i += 1
-            curr = curr.children[i]
+            curr = curr.children[bisect_right(curr.keys, key)]
 
+        if curr.keys:
+            self._leaf_cache.append((curr.keys[0], curr.keys[-1], curr))
         return curr
 
-    def _find_parent(self, curr, child):
+    def _invalidate(self, node):
         """
-        Find the parent of `child` starting from `curr` node.
+        Drop the memoized to_dict() form of `node` and every ancestor.
 
-        Args:
-            curr: Node to start searching from (usually root)
-            child: Node whose parent to find
-
-        Returns:
-            The parent node if found, otherwise None
-        """
-        # If curr is leaf, it cannot be parent
-        if curr is None or curr.is_leaf:
-            return None
-        for c in curr.children:
-            if c is child:
-                return curr
-        # Recurse into children
-        for c in curr.children:
-            if not c.is_leaf:
-                parent = self._find_parent(c, child)
-                if parent is not None:
-                    return parent
-        return None
+        A clean node never sits below a dirty one, so the walk stops at the first
+        ancestor that is already dirty.
+        """
+        while node is not None and node._cached_dict is not None:
+            node._cached_dict = None
+            node = node.parent
 
     def _split_leaf(self, node):
         """
@@ -280,8 +305,9 @@ class BPlusTree:
         Returns:
             The new right node and the middle key
         """
+        self._leaf_cache.clear()
         mid_index = len(node.keys) // 2
-        new_leaf = BPlusTreeNode(is_leaf=True)
+        new_leaf = BPlusTreeNode(is_leaf=True, int_keys=self.int_keys)
         
         # Move half the keys and values to the new leaf
         new_leaf.keys = node.keys[mid_index:]
@@ -294,23 +320,24 @@ class BPlusTree:
         node.next = new_leaf
         
         # Promote the first key of the new leaf to the parent
-        if node == self.root:
+        if node is self.root:
             # Create a new root
-            new_root = BPlusTreeNode(is_leaf=False)
-            new_root.keys = [new_leaf.keys[0]]
+            new_root = BPlusTreeNode(is_leaf=False, int_keys=self.int_keys)
+            new_root.keys.append(new_leaf.keys[0])
             new_root.children = [node, new_leaf]
+            node.parent = new_root
+            new_leaf.parent = new_root
             self.root = new_root
         else:
-            # Find parent and insert the promoted key
-            parent = self._find_parent(self.root, node)
-            insert_index = 0
-            while insert_index < len(parent.keys) and parent.keys[insert_index] < new_leaf.keys[0]:
-                insert_index += 1
+            # Insert the promoted key into the parent
+            parent = node.parent
+            new_leaf.parent = parent
+            insert_index = bisect.bisect_left(parent.keys, new_leaf.keys[0])
             parent.keys.insert(insert_index, new_leaf.keys[0])
             parent.children.insert(insert_index + 1, new_leaf)
             
             # Check for overflow in parent
-            if len(parent.keys) > self.order - 1:
+            if len(parent.keys) > self._max_keys:
                 self._split_internal(parent)
 
     def _split_internal(self, node):
@@ -328,7 +355,7 @@ class BPlusTree:
         promoted_key = node.keys[mid_index]
 
         # Create new right internal node
-        new_node = BPlusTreeNode(is_leaf=False)
+        new_node = BPlusTreeNode(is_leaf=False, int_keys=self.int_keys)
 
         # Right node takes keys after the promoted key
         new_node.keys = node.keys[mid_index + 1:]
@@ -336,28 +363,31 @@ class BPlusTree:
         # Children split: left keeps children up to mid_index, right takes the rest
         # For internal nodes with k keys there are k+1 children
         new_node.children = node.children[mid_index + 1:]
+        for c in new_node.children:
+            c.parent = new_node
 
         # Left (existing) node keeps keys before mid_index and corresponding children
         node.keys = node.keys[:mid_index]
         node.children = node.children[:mid_index + 1]
 
         # If splitting the root, create a new root
-        if node == self.root:
-            new_root = BPlusTreeNode(is_leaf=False)
-            new_root.keys = [promoted_key]
+        if node is self.root:
+            new_root = BPlusTreeNode(is_leaf=False, int_keys=self.int_keys)
+            new_root.keys.append(promoted_key)
             new_root.children = [node, new_node]
+            node.parent = new_root
+            new_node.parent = new_root
             self.root = new_root
         else:
-            # Find parent and insert promoted key and new child
-            parent = self._find_parent(self.root, node)
-            insert_index = 0
-            while insert_index < len(parent.keys) and parent.keys[insert_index] < promoted_key:
-                insert_index += 1
+            # Insert promoted key and new child into the parent
+            parent = node.parent
+            new_node.parent = parent
+            insert_index = bisect.bisect_left(parent.keys, promoted_key)
             parent.keys.insert(insert_index, promoted_key)
             parent.children.insert(insert_index + 1, new_node)
 
             # If parent now overflows, split it too
-            if len(parent.keys) > self.order - 1:
+            if len(parent.keys) > self._max_keys:
                 self._split_internal(parent)
 
     def _merge_nodes(self, left, right=None, parent=None, parent_index=None):
@@ -366,7 +396,8 @@ class BPlusTree:
 
         This method supports two calling styles:
         - _merge_nodes(node): Node is the one that underflowed; the method
-          will locate its parent and a sibling and merge appropriately.
+          will locate its parent and first try to borrow a key from a sibling
+          that can spare one, merging only if neither can.
         - _merge_nodes(left, right, parent, parent_index): Explicitly provide
           the two siblings, their parent, and the index of the left child in
           parent's children list.
@@ -379,19 +410,24 @@ class BPlusTree:
             parent_index: Index of the left node in parent's children (optional)
 
         Returns:
-            True if merge was performed, False otherwise
+            True if the underflow was fixed (borrow or merge), False otherwise
         """
 
         # Allow being called with a single argument: the node that underflowed.
         # In that case, find its parent and a sibling to merge with.
         if right is None:
             node = left
-            parent = self._find_parent(self.root, node)
+            parent = node.parent
             # If there is no parent, node is root — nothing to merge
             if parent is None:
                 return False
 
+            # Nodes define no __eq__, so list.index() is a C-level identity scan
             idx = parent.children.index(node)
+            # Rebalance without touching the parent's shape when a sibling can spare a key
+            if self._borrow_from_sibling(node, parent, idx):
+                return True
+
             # Prefer merging with right sibling if available
             if idx + 1 < len(parent.children):
                 left = node
@@ -406,11 +442,16 @@ class BPlusTree:
                 return False
 
         # Now left, right, parent, parent_index should be set
+        self._leaf_cache.clear()
+        self._invalidate(left)
+        self._invalidate(right)
         if left.is_leaf:
             # Merge right into left for leaf nodes
             left.keys.extend(right.keys)
             left.values.extend(right.values)
             left.next = right.next
+            if self._leftmost_leaf is right:
+                self._leftmost_leaf = left
 
             # Remove separator key and right child from parent
             if parent is not None and parent_index is not None and parent_index < len(parent.keys):
@@ -426,34 +467,86 @@ class BPlusTree:
             left.keys.append(sep_key)
             left.keys.extend(right.keys)
             left.children.extend(right.children)
+            for c in right.children:
+                c.parent = left
 
             # Remove separator and right child from parent
             parent.keys.pop(parent_index)
             parent.children.pop(parent_index + 1)
 
         # If parent is root and becomes empty, make left the new root
-        if parent == self.root and len(parent.keys) == 0:
+        if parent is self.root and len(parent.keys) == 0:
+            left.parent = None
             self.root = left
             return True
 
         # If parent underflows, try to fix by merging up the tree
-        if parent is not None and len(parent.keys) < (self.order - 1) // 2:
+        if parent is not None and len(parent.keys) < self._min_keys:
             # Find parent's parent and attempt to merge parent upward
-            parent_parent = self._find_parent(self.root, parent)
+            parent_parent = parent.parent
             if parent_parent is None:
                 # parent is root; if empty we've already handled, otherwise nothing
                 if len(parent.keys) == 0:
                     self.root = parent.children[0]
+                    self.root.parent = None
                 return True
-            p_idx = parent_parent.children.index(parent)
-            # Prefer merging parent with right sibling
-            if p_idx + 1 < len(parent_parent.children):
-                self._merge_nodes(parent, parent_parent.children[p_idx + 1], parent_parent, p_idx)
-            else:
-                self._merge_nodes(parent_parent.children[p_idx - 1], parent, parent_parent, p_idx - 1)
+            # Borrow for (or merge) the parent the same way, one level up
+            self._merge_nodes(parent)
 
         return True
 
+    def _borrow_from_sibling(self, node, parent, idx):
+        """
+        Fix an underflowing node by moving one entry over from an adjacent sibling.
+
+        Leaves take the sibling's edge key/value and refresh the parent separator;
+        internal nodes rotate through the parent separator and adopt the edge child.
+
+        Args:
+            node: The underflowing node
+            parent: Its parent node
+            idx: Index of `node` in parent.children
+
+        Returns:
+            True if a sibling could spare an entry, False if a merge is required
+        """
+        self._leaf_cache.clear()
+        if idx > 0:
+            left = parent.children[idx - 1]
+            if len(left.keys) > self._min_keys:
+                self._invalidate(left)
+                self._invalidate(node)
+                if node.is_leaf:
+                    node.keys.insert(0, left.keys.pop())
+                    node.values.insert(0, left.values.pop())
+                    parent.keys[idx - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[idx - 1])
+                    parent.keys[idx - 1] = left.keys.pop()
+                    child = left.children.pop()
+                    child.parent = node
+                    node.children.insert(0, child)
+                return True
+
+        if idx + 1 < len(parent.children):
+            right = parent.children[idx + 1]
+            if len(right.keys) > self._min_keys:
+                self._invalidate(right)
+                self._invalidate(node)
+                if node.is_leaf:
+                    node.keys.append(right.keys.pop(0))
+                    node.values.append(right.values.pop(0))
+                    parent.keys[idx] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[idx])
+                    parent.keys[idx] = right.keys.pop(0)
+                    child = right.children.pop(0)
+                    child.parent = node
+                    node.children.append(child)
+                return True
+
+        return False
+
     def traverse(self):
         """
         Traverse the B+ tree in order.
@@ -461,11 +554,8 @@ class BPlusTree:
         Returns:
             Generator yielding (key, value) pairs in ascending order of keys
         """
-        current = self.root
-        # Go to the leftmost leaf
-        while not current.is_leaf:
-            current = current.children[0]
-        
+        current = self._leftmost_leaf
+
         # Traverse leaf nodes
         while current:
             for k, v in zip(current.keys, current.values):
@@ -489,16 +579,35 @@ class BPlusTree:
     # Serialization (JSON only, no pickle)
     # -----------------
     def to_dict(self):
-        """Return a JSON-serializable dict representing the tree."""
-        def node_to_dict(node):
+        """
+        Return a JSON-serializable dict representing the tree.
+
+        Subtree dicts are memoized on their nodes and reused until a mutation
+        dirties them, so callers must treat the result as read-only.
+        """
+        # Iterative top-down build: each child dict is written into a preallocated
+        # slot of its parent's "children" list, so no recursion is needed.
+        holder = [None]
+        stack = [(self.root, holder, 0)]
+        while stack:
+            node, slots, i = stack.pop()
+            if node._cached_dict is not None:
+                slots[i] = node._cached_dict
+                continue
             nd = {"is_leaf": node.is_leaf, "keys": list(node.keys)}
             if node.is_leaf:
                 nd["values"] = list(node.values)
             else:
-                nd["children"] = [node_to_dict(c) for c in node.children]
-            return nd
+                children = [None] * len(node.children)
+                nd["children"] = children
+                stack.extend((c, children, j) for j, c in enumerate(node.children))
+            node._cached_dict = nd
+            slots[i] = nd
 
-        return {"order": self.order, "root": node_to_dict(self.root)}
+        d = {"order": self.order, "root": holder[0]}
+        if self.int_keys:
+            d["int_keys"] = True
+        return d
 
     def to_json(self):
         """Return a JSON string for the tree."""
@@ -507,33 +616,104 @@ class BPlusTree:
     @classmethod
     def from_dict(cls, d):
         """Reconstruct a BPlusTree from a dictionary produced by to_dict()."""
-        def dict_to_node(nd):
-            node = BPlusTreeNode(is_leaf=nd.get("is_leaf", False))
-            node.keys = list(nd.get("keys", []))
-            if node.is_leaf:
-                node.values = list(nd.get("values", []))
-            else:
-                node.children = [dict_to_node(c) for c in nd.get("children", [])]
-            return node
+        int_keys = bool(d.get("int_keys", False))
+
+        tree = cls(order=d.get("order", 4), int_keys=int_keys)
+
+        # Rebuild nodes top-down with an explicit stack (no recursion). Children are
+        # pushed right-to-left so leaves come off the stack in key order, which lets
+        # us stitch the leaf `next` chain in the same pass.
+        if d.get("root") is not None:
+            holder = [None]
+            stack = [(d["root"], None, holder, 0)]
+            prev_leaf = None
+            while stack:
+                nd, parent, slots, i = stack.pop()
+                node = BPlusTreeNode(is_leaf=nd.get("is_leaf", False), int_keys=int_keys)
+                node.parent = parent
+                node.keys.extend(nd.get("keys", []))
+                if node.is_leaf:
+                    node.values = list(nd.get("values", []))
+                    if prev_leaf is None:
+                        tree._leftmost_leaf = node
+                    else:
+                        prev_leaf.next = node
+                    prev_leaf = node
+                else:
+                    child_dicts = nd.get("children", [])
+                    node.children = [None] * len(child_dicts)
+                    for j in range(len(child_dicts) - 1, -1, -1):
+                        stack.append((child_dicts[j], node, node.children, j))
+                slots[i] = node
+            tree.root = holder[0]
 
-        tree = cls(order=d.get("order", 4))
-        tree.root = dict_to_node(d["root"]) if d.get("root") is not None else BPlusTreeNode(is_leaf=True)
+        return tree
 
-        # Reconstruct leaf next pointers by collecting leaves left-to-right
-        leaves = []
-        def collect_leaves(node):
-            if node.is_leaf:
-                leaves.append(node)
-            else:
-                for c in node.children:
-                    collect_leaves(c)
+    @classmethod
+    def bulk_load(cls, items, order=128, int_keys=False):
+        """
+        Build a tree bottom-up from (key, value) pairs already sorted by key.
+
+        Leaves are packed left to right and each internal level is built once over
+        the level below, so every node is written exactly once and no splits occur.
+        Node sizes are spread evenly so every non-root node meets the minimum fill.
+
+        Args:
+            items: Iterable of (key, value) pairs in strictly increasing key order
+            order (int): Same meaning as in __init__
+            int_keys (bool): Same meaning as in __init__
+
+        Returns:
+            BPlusTree: The populated tree
 
-        collect_leaves(tree.root)
-        for i in range(len(leaves) - 1):
-            leaves[i].next = leaves[i + 1]
-        if leaves:
-            leaves[-1].next = None
+        >>> t = BPlusTree.bulk_load(((k, k * 10) for k in range(1, 11)), order=4)
+        >>> t.search(7), t.range_search(3, 5), len(list(t.traverse()))
+        (70, [(3, 30), (4, 40), (5, 50)], 10)
+        >>> t.insert(11, 110), t.delete(1), t.search(11)
+        (True, True, 110)
+        """
+        tree = cls(order=order, int_keys=int_keys)
+        pairs = list(items)
+        if not pairs:
+            return tree
+
+        def _chunks(n, cap):
+            # Split n entries into ceil(n / cap) groups whose sizes differ by at most one
+            groups = -(-n // cap)
+            size, extra = divmod(n, groups)
+            start = 0
+            for g in range(groups):
+                end = start + size + (1 if g < extra else 0)
+                yield start, end
+                start = end
+
+        # Leaf level: (node, smallest key in its subtree)
+        level = []
+        prev_leaf = None
+        for start, end in _chunks(len(pairs), tree._max_keys):
+            leaf = BPlusTreeNode(is_leaf=True, int_keys=int_keys)
+            leaf.keys.extend(k for k, _ in pairs[start:end])
+            leaf.values = [v for _, v in pairs[start:end]]
+            if prev_leaf is not None:
+                prev_leaf.next = leaf
+            prev_leaf = leaf
+            level.append((leaf, leaf.keys[0]))
+        tree._leftmost_leaf = level[0][0]
+
+        # Internal levels: each separator is the smallest key of the child to its right
+        while len(level) > 1:
+            parents = []
+            for start, end in _chunks(len(level), tree.order):
+                node = BPlusTreeNode(is_leaf=False, int_keys=int_keys)
+                group = level[start:end]
+                node.children = [child for child, _ in group]
+                node.keys.extend(low for _, low in group[1:])
+                for child in node.children:
+                    child.parent = node
+                parents.append((node, group[0][1]))
+            level = parents
 
+        tree.root = level[0][0]
         return tree
 
     @classmethod
@@ -0,0 +1,64 @@
+"""
+SQLite-backed table catalog for a Database directory.
+
+One row per table in a `tables(name, num_columns, key_index)` relation stored in
+<DATA_DIR>/<config.CATALOG_FILE>. Replaces the whole-file metadata.json rewrite
+with a single transaction of row upserts; Database.open() still falls back to a
+legacy metadata.json when no catalog exists yet.
+"""
+
+import sqlite3
+
+
+def open_catalog(path):
+    """
+    Open (creating if needed) the catalog database at 'path'.
+
+    Args:
+        path (str|Path): Filesystem path of the SQLite file.
+
+    Returns:
+        sqlite3.Connection: Connection with the `tables` relation present.
+    """
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS tables ("
+        " name TEXT PRIMARY KEY,"
+        " num_columns INTEGER NOT NULL,"
+        " key_index INTEGER NOT NULL)"
+    )
+    return conn
+
+
+def load_tables(conn):
+    """
+    Read every catalog row.
+
+    Returns:
+        list[dict]: [{"name", "num_columns", "key_index"}, ...] in name order.
+    """
+    rows = conn.execute("SELECT name, num_columns, key_index FROM tables ORDER BY name")
+    return [{"name": n, "num_columns": c, "key_index": k} for n, c, k in rows]
+
+
+def save_tables(conn, tables):
+    """
+    Make the catalog match 'tables' in one transaction.
+
+    Rows for tables that are no longer registered (dropped) are removed; the
+    rest are upserted.
+
+    Args:
+        conn (sqlite3.Connection): Catalog connection from open_catalog().
+        tables (Iterable[Table]): Registered tables (name, num_columns, key).
+    """
+    rows = [(t.name, t.num_columns, t.key) for t in tables]
+    with conn:
+        names = [r[0] for r in rows]
+        conn.execute(
+            f"DELETE FROM tables WHERE name NOT IN ({','.join('?' * len(names))})",
+            names,
+        )
+        conn.executemany("INSERT OR REPLACE INTO tables VALUES (?, ?, ?)", rows)
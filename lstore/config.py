@@ -34,6 +34,8 @@ META_COLUMNS = 4                # count of metadata columns; user columns follow
 # ----------------------------
 BUFFERPOOL_SIZE = 64            # number of page frames held in memory (up to 256 for faster tests)
 FLUSH_ON_CLOSE = True           # Database.close() will flush dirty pages via the buffer pool
+CFLRU_WINDOW = 32               # eviction prefers clean frames among this many LRU-end frames
+WRITEBACK_INLINE_MAX = 16       # flushes of at most this many dirty pages skip the writeback thread pool
 
 # ----------------------------
 # Page sizing
@@ -46,14 +48,22 @@ MAX_RECORDS_PER_PAGE = 512      # slots per column page (do not change unless te
 BASE_PAGE_PREFIX = "B"                 # tag for base pages (informational)
 TAIL_PAGE_PREFIX = "T"                 # tag for tail pages (informational)
 PAGE_ID_STYLE = "underscore"           # current project uses: <table>_<col>_<pageNo>_<isBase(0|1)>
-PAGE_FILE_SUFFIX = ".page.json"        # per-page file extension (human-readable JSON)
+PAGE_FILE_SUFFIX = ".page"             # per-page file extension (binary: header + int64 cells)
+LEGACY_PAGE_FILE_SUFFIX = ".page.json" # older JSON pages; still read (never written) for old databases
 
 # ----------------------------
 # DB-level durability metadata
 # ----------------------------
-DB_METADATA_FILE = "metadata.json"     # lists tables and basic info for Database.open()
+CATALOG_FILE = "catalog.db"            # SQLite catalog: one row per table for Database.open()
+DB_METADATA_FILE = "metadata.json"     # legacy JSON table list (read only if no catalog exists)
 TABLE_FILE_SUFFIX = ".table.json"      # optional per-table snapshot (kept for compatibility)
 
+# ----------------------------
+# Indexes
+# ----------------------------
+ENABLE_PROBE_CACHE = False             # Index.locate_any() probes one sorted hash table across all indexed columns
+ROBUST_PK_SCAN = False                 # on a PK-index miss, also scan base key pages (tests/recovery only)
+
 # ----------------------------
 # RID allocation policy
 # ----------------------------
@@ -1,6 +1,9 @@
 from .table import Table
 from .pagebuffer import Bufferpool
+from .catalog import open_catalog, load_tables, save_tables
 from . import config
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import os, json
 
 
@@ -11,8 +14,8 @@ class Database:
 
     Responsibilities:
       • Hold Table objects and the Bufferpool.
-      • open(path): set the DB root directory and recreate tables from metadata.
-      • close(): write metadata and flush dirty pages (if enabled).
+      • open(path): set the DB root directory and recreate tables from the catalog.
+      • close(): flush dirty pages (if enabled) and write the catalog.
     """
 
     def __init__(self):
@@ -20,11 +23,13 @@ class Database:
         Initialize an empty Database shell.
 
         Attributes:
-            tables (list[Table]): Registered tables in this database.
+            tables (list[Table]): Registered tables in this database (creation order).
+            _tables_by_name (dict[str, Table]): Name -> Table lookup kept in sync with tables.
             bufferpool (Bufferpool): Shared buffer manager used by all tables.
             _base_dir (str | None): Filesystem root for this DB; set by open().
         """
         self.tables = []
+        self._tables_by_name = {}
         self.bufferpool = Bufferpool(self)
         self._base_dir = None   # set in open()
 
@@ -32,10 +37,11 @@ class Database:
         """
         Open (or initialize) a database at the given filesystem path.
 
-        Creates the directory if it does not exist. If a metadata file
-        (config.DB_METADATA_FILE) is found, this method reconstructs each table
-        described there, links it to the buffer pool, and invokes Table.recover()
-        to rebuild page_directory and indexes lazily from per-page files.
+        Creates the directory if it does not exist. If a catalog
+        (config.CATALOG_FILE) or a legacy metadata file (config.DB_METADATA_FILE)
+        is found, this method reconstructs each table described there, links it
+        to the buffer pool, and invokes Table.recover() to rebuild page_directory
+        and indexes lazily from per-page files.
 
         Args:
             path (str): Filesystem path like "./CS451" where metadata will live.
@@ -53,12 +59,21 @@ class Database:
 
         os.makedirs(self._base_dir, exist_ok=True)
 
-        meta_file = os.path.join(self._base_dir, getattr(config, "DB_METADATA_FILE", "metadata.json"))
-        if not os.path.exists(meta_file):
+        catalog_file = self._catalog_path()
+        meta_file = self._meta_path()
+        if catalog_file.exists():
+            conn = open_catalog(catalog_file)
+            try:
+                table_infos = load_tables(conn)
+            finally:
+                conn.close()
+        elif meta_file.exists():
+            # legacy layout: one read of raw bytes; json decodes UTF-8 bytes directly
+            table_infos = json.loads(meta_file.read_bytes()).get("tables", [])
+        else:
             return  # first run; tables will be created via create_table()
 
-        meta = json.loads(open(meta_file, "r").read())
-        for tinfo in meta.get("tables", []):
+        for tinfo in table_infos:
             name = tinfo["name"]
             # num_columns here means USER columns (excludes meta columns)
             num_columns = int(tinfo["num_columns"])
@@ -71,13 +86,14 @@ class Database:
                 table.recover()
 
             # Avoid duplicates if open() is called more than once
-            if not any(tb.name == name for tb in self.tables):
+            if name not in self._tables_by_name:
                 self.tables.append(table)
+                self._tables_by_name[name] = table
 
     def close(self):
         """
-        Persist lightweight DB metadata, optionally run a merge on close if
-        MERGE_ON_CLOSE is enabled, and flush dirty pages.
+        Optionally run a merge on close if MERGE_ON_CLOSE is enabled, flush dirty
+        pages (one worker per table), then persist lightweight DB metadata.
 
         Notes:
         - We do NOT merge on close unless config.MERGE_ON_CLOSE is True.
@@ -89,25 +105,11 @@ class Database:
         except Exception:
             pass
 
-        # ---- write database metadata (table list) ----
-        try:
-            meta = {
-                "tables": [
-                    {"name": t.name, "num_columns": t.num_columns, "key_index": t.key}
-                    for t in (self.tables.values() if isinstance(self.tables, dict) else self.tables)
-                ]
-            }
-            meta_file = os.path.join(self._base_dir, getattr(config, "DB_METADATA_FILE", "metadata.json"))
-            with open(meta_file, "w") as f:
-                json.dump(meta, f)
-        except Exception:
-            # Metadata is best-effort; keep going so we still flush/merge as configured
-            pass
+        tables = list(self.tables.values() if isinstance(self.tables, dict) else self.tables)
 
         # ---- optional: merge on close (only if explicitly enabled) ----
         if getattr(config, "MERGE_ON_CLOSE", False):
             try:
-                tables = self.tables.values() if isinstance(self.tables, dict) else self.tables
                 for t in tables:
                     if hasattr(t, "merge"):
                         t.merge()
@@ -116,12 +118,47 @@ class Database:
                 pass
 
         # ---- flush dirty pages to disk (default True) ----
+        # Each table's pages live in their own files, so the per-table flushes overlap.
         try:
             if getattr(config, "FLUSH_ON_CLOSE", True) and hasattr(self, "bufferpool") and self.bufferpool:
-                self.bufferpool.flush_all()
+                if tables:
+                    with ThreadPoolExecutor(max_workers=min(8, len(tables))) as ex:
+                        list(ex.map(self.bufferpool.flush_table, [t.name for t in tables]))
+                self.bufferpool.flush_all()  # anything not owned by a registered table
+        except Exception:
+            pass
         finally:
-            # If you keep any open file handles or background resources on Database, release them here.
-            return
+            if getattr(self, "bufferpool", None):
+                self.bufferpool.shutdown()  # release the writeback threads
+
+        # ---- write the table catalog last, once the pages are on disk ----
+        try:
+            conn = open_catalog(self._catalog_path())
+            try:
+                save_tables(conn, tables)
+            finally:
+                conn.close()
+        except Exception:
+            # Metadata is best-effort
+            pass
+
+    def _catalog_path(self):
+        """
+        Location of the SQLite table catalog (config.CATALOG_FILE) under the DB root.
+
+        Returns:
+            Path: <base_dir>/<CATALOG_FILE>
+        """
+        return Path(self._base_dir) / getattr(config, "CATALOG_FILE", "catalog.db")
+
+    def _meta_path(self):
+        """
+        Location of the legacy JSON metadata file (config.DB_METADATA_FILE) under the DB root.
+
+        Returns:
+            Path: <base_dir>/<DB_METADATA_FILE>
+        """
+        return Path(self._base_dir) / getattr(config, "DB_METADATA_FILE", "metadata.json")
 
     def create_table(self, name, num_columns, key_index):
         """
@@ -138,12 +175,13 @@ class Database:
         Raises:
             ValueError: If a table with the same name already exists in this DB.
         """
-        if any(t.name == name for t in self.tables):
+        if name in self._tables_by_name:
             raise ValueError("Table already exists")
 
         table = Table(name, num_columns, key_index)
         table.link_page_buffer(self.bufferpool)
         self.tables.append(table)
+        self._tables_by_name[name] = table
         return table
 
     def drop_table(self, name):
@@ -160,12 +198,12 @@ class Database:
         Raises:
             ValueError: If no table with that name is registered.
         """
-        for i, table in enumerate(self.tables):
-            if table.name == name:
-                self.tables[i].delete()  # allow the table to release any resources
-                del self.tables[i]
-                return
-        raise ValueError("Table not found")
+        table = self._tables_by_name.pop(name, None)
+        if table is None:
+            raise ValueError("Table not found")
+        table.delete()  # allow the table to release any resources
+        self.tables.remove(table)
+        self.bufferpool.invalidate_table_cache(name)
 
     def get_table(self, name):
         """
@@ -180,7 +218,7 @@ class Database:
         Raises:
             ValueError: If the table name is not registered.
         """
-        for table in self.tables:
-            if table.name == name:
-                return table
-        raise ValueError("Table not found")
+        table = self._tables_by_name.get(name)
+        if table is None:
+            raise ValueError("Table not found")
+        return table
@@ -1,19 +1,44 @@
 """
 Per-column secondary indexes for a Table.
 
-An Index maps a user-column value -> list of base RIDs that currently hold that
-value (latest version semantics are handled by the table/query layer). The
+An Index maps a user-column value -> the base RIDs that currently hold that
+value (latest version semantics are handled by the table/query layer). The PK
+column maps to a singleton list; other columns keep an insertion-ordered dict
+used as a set (rid -> None) so removing one RID is O(1). The
 primary-key column is indexed by default; other user columns can be indexed
 on demand.
 
 Notes:
 - 'table.num_columns' counts USER columns only; meta columns (INDIRECTION, RID,
   TIMESTAMP, SCHEMA) live at the front and are not indexable.
-- RIDs may be integers (preferred) or legacy strings like "b123". We treat only
-  base RIDs as candidates for indexing.
+- Postings hold integer RIDs only. Legacy string RIDs ("b123" / "t5") are
+  converted once on the way in, with tails mapped above config.TAIL_RID_START,
+  so a base-vs-tail test is a single integer compare.
 """
 
 from lstore import config
+from lstore.bplustree import BPlusTree
+import array
+import bisect
+import itertools
+
+_PROBE_MASK = (1 << 48) - 1   # probe-cache hash: low 48 bits of the value
+
+
+def _int_rid(rid):
+    """
+    Normalize a RID to its integer form.
+
+    Args:
+        rid (int|str): Integer RID, or a legacy "b<n>" / "t<n>" string.
+
+    Returns:
+        int: Base RIDs unchanged; legacy tail strings offset by TAIL_RID_START.
+    """
+    if isinstance(rid, str):
+        n = int(rid[1:])
+        return n if rid[0] == 'b' else n + getattr(config, "TAIL_RID_START", 10**9)
+    return int(rid)
 
 
 class Index:
@@ -24,7 +49,13 @@ class Index:
         table (Table): The owning table.
         num_user_cols (int): Number of user columns (excludes meta columns).
         indices (list[dict|None]): One dict per user column, or None if absent.
-                                   Dicts map 'value -> [base_rid, ...]'.
+                                   PK: 'value -> [base_rid]'; others:
+                                   'value -> {base_rid: None, ...}'.
+        ordered (list[BPlusTree|None]): Per indexed column, the distinct values in
+                                   sorted order (tree values unused) so range
+                                   probes avoid scanning every dict key.
+        _probe_hashes, _probe_cols (array|None): Optional cross-column probe cache
+                                   (see build_probe_cache); None when stale.
     """
 
     def __init__(self, table):
@@ -38,6 +69,9 @@ class Index:
         self.table = table
         self.num_user_cols = table.num_columns
         self.indices = [None] * table.num_columns
+        self.ordered = [None] * table.num_columns
+        self._probe_hashes = None
+        self._probe_cols = None
         # PK is indexed by default
         self.create_index(table.key)
 
@@ -52,14 +86,17 @@ class Index:
             value (int):  The value to probe.
 
         Returns:
-            list[int] | list[str]: List of matching base RIDs; empty list if no index
+            list[int]: List of matching base RIDs; empty list if no index
                                    or no matches.
         """
         if column < 0 or column >= self.num_user_cols:
             return []
         if self.indices[column] is None:
             return []
-        return self.indices[column].get(value, [])
+        postings = self.indices[column].get(value)
+        if not postings:
+            return []
+        return postings if column == self.table.key else list(postings)
 
     def locate_range(self, begin, end, column):
         """
@@ -71,30 +108,81 @@ class Index:
             column (int): 0-based user-column index.
 
         Returns:
-            list[int] | list[str]: Collected base RIDs in non-decreasing value order
-                                   (dictionary iteration order is unspecified).
+            list[int]: Collected base RIDs in non-decreasing value order.
         """
         if column < 0 or column >= self.num_user_cols:
             return []
-        if self.indices[column] is None:
+        m = self.indices[column]
+        if m is None:
             return []
 
         result = []
-        # Simple dictionary scan; could be replaced with a B+Tree for efficiency.
-        for value, rids in self.indices[column].items():
-            if begin <= value <= end:
+        # Walk the sorted distinct values in range; postings come from the dict.
+        # Values removed from the dict behind our back are simply skipped.
+        for value, _ in self.ordered[column].range_search(begin, end):
+            rids = m.get(value)
+            if rids:
                 result.extend(rids)
         return result
 
+    def build_probe_cache(self):
+        """
+        Build one flat lookup table over the values of every indexed column.
+
+        Entries are (low 48 bits of value, column) pairs sorted by hash and stored
+        in two packed arrays, so locate_any() does a single binary search instead
+        of probing each column's dict. Values removed later only leave harmless
+        stale entries (hits are verified against the dicts); new values mark the
+        cache stale and it is rebuilt on the next locate_any().
+        """
+        pairs = sorted(
+            (value & _PROBE_MASK, col)
+            for col, m in enumerate(self.indices) if m is not None
+            for value in m
+        )
+        self._probe_hashes = array.array('Q', (h for h, _ in pairs))
+        self._probe_cols = array.array('H', (col for _, col in pairs))
+
+    def locate_any(self, value):
+        """
+        Find 'value' in every indexed column at once.
+
+        Uses the probe cache when config.ENABLE_PROBE_CACHE is set, otherwise
+        checks each indexed column's dict in turn.
+
+        Args:
+            value (int): The value to probe.
+
+        Returns:
+            dict[int, list[int]]: column -> matching base RIDs, only for columns
+                                  that contain the value.
+        """
+        if not getattr(config, "ENABLE_PROBE_CACHE", False):
+            return {col: self.locate(col, value)
+                    for col, m in enumerate(self.indices) if m is not None and value in m}
+
+        if self._probe_hashes is None:
+            self.build_probe_cache()
+        hashes, cols = self._probe_hashes, self._probe_cols
+        h = value & _PROBE_MASK
+        found = {}
+        i = bisect.bisect_left(hashes, h)
+        while i < len(hashes) and hashes[i] == h:
+            rids = self.locate(cols[i], value)  # full-key check against the column dict
+            if rids:
+                found[cols[i]] = rids
+            i += 1
+        return found
+
     def insert_entry(self, rid, columnNum, value):
         """
         Add a single (value -> rid) association to the index on 'columnNum'.
 
         For the primary key column we enforce uniqueness by overwriting with a
-        singleton list. For non-PK columns we append to a posting list.
+        singleton list. For non-PK columns we add to the value's posting set.
 
         Args:
-            rid (int|str): Base RID to index.
+            rid (int|str): Base RID to index (legacy strings are converted).
             columnNum (int): 0-based user-column index.
             value (int): Column value stored at that RID.
 
@@ -103,37 +191,40 @@ class Index:
         """
         if columnNum < 0 or columnNum >= self.num_user_cols:
             return
+        rid = _int_rid(rid)
         if self.indices[columnNum] is None:
             self.indices[columnNum] = {}
+            self.ordered[columnNum] = BPlusTree()
+
+        m = self.indices[columnNum]
+        postings = m.get(value)
+        if postings is None:
+            self.ordered[columnNum].insert(value, None)
+            self._probe_hashes = None
 
         if columnNum == self.table.key:
-            # PK is unique by definition.
-            self.indices[columnNum][value] = [rid]
+            # PK is unique by definition; replaying the same (value, rid) allocates nothing.
+            if postings is None or postings[0] != rid:
+                m[value] = [rid]
             return
 
-        if value not in self.indices[columnNum]:
-            self.indices[columnNum][value] = []
-        self.indices[columnNum][value].append(rid)
+        if postings is None:
+            postings = m[value] = {}
+        postings[rid] = None
 
     def _is_base_rid(self, rid):
         """
-        Heuristic to decide whether a RID refers to a base record.
+        Decide whether an (integer) RID refers to a base record.
 
-        Supports both integer RIDs and legacy string RIDs ("b123").
         Tails are assumed to live at or beyond config.TAIL_RID_START.
 
         Args:
-            rid (int|str): RID to classify.
+            rid (int): RID to classify.
 
         Returns:
             bool: True iff 'rid' is a base RID.
         """
-        if isinstance(rid, str):
-            return rid.startswith('b')
-        try:
-            return int(rid) < getattr(config, "TAIL_RID_START", 10**9)
-        except Exception:
-            return False
+        return rid < getattr(config, "TAIL_RID_START", 10**9)
 
     def create_index(self, column_number):
         """Build an index for the given user column from each base RID's latest value."""
@@ -142,26 +233,26 @@ class Index:
         if self.indices[column_number] is not None:
             raise ValueError("Index already exists for this column")
 
-        self.indices[column_number] = {}
-
-        # Populate from each base RID's *latest* value
-        for rid in self.table.page_directory.keys():
-            # base RIDs only
-            if isinstance(rid, str):
-                if not rid.startswith('b'):
-                    continue
-            else:
-                if rid >= getattr(config, "TAIL_RID_START", 10**9):
-                    continue
-
-            vals = self.table._materialize_latest_user_values(rid)  # user-only list
-            value = vals[column_number]
-            if column_number == self.table.key:
-                # enforce uniqueness for PK
-                self.indices[column_number][value] = [rid]
-            else:
-                self.indices[column_number].setdefault(value, []).append(rid)
-
+        # Populate from each base RID's *latest* value, reading only this column
+        rids, vals = self.table._column_latest_values(config.META_COLUMNS + column_number)
+        if column_number == self.table.key:
+            # enforce uniqueness for PK
+            m = dict(zip(vals, ([rid] for rid in rids)))
+            distinct = sorted(m)
+        else:
+            # Group-by: one stable sort of row positions by value, then each run of
+            # equal values becomes a posting set (RID order kept) and the runs
+            # arrive already sorted for the ordered-values tree.
+            m = {}
+            distinct = []
+            by_value = sorted(range(len(vals)), key=vals.__getitem__)
+            for value, positions in itertools.groupby(by_value, key=vals.__getitem__):
+                m[value] = dict.fromkeys(rids[i] for i in positions)
+                distinct.append(value)
+        self.indices[column_number] = m
+        # Sorted input: build the tree bottom-up instead of one insert per value
+        self.ordered[column_number] = BPlusTree.bulk_load((value, None) for value in distinct)
+        self._probe_hashes = None
 
     def drop_index(self, column_number):
         """
@@ -176,6 +267,8 @@ class Index:
         if column_number < 0 or column_number >= self.num_user_cols:
             raise ValueError("Invalid column number")
         self.indices[column_number] = None
+        self.ordered[column_number] = None
+        self._probe_hashes = None
 
     def update_entry(self, rid, column_number, old_value, new_value):
         """
@@ -189,16 +282,18 @@ class Index:
         m = self.indices[column_number]
         if m is None or old_value == new_value:
             return
+        rid = _int_rid(rid)
 
-        # remove from old list
-        lst = m.get(old_value)
-        if lst is not None:
-            for i in range(len(lst) - 1, -1, -1):
-                if lst[i] == rid:
-                    lst.pop(i)
-                    break
-            if not lst:
+        # remove from old posting set
+        postings = m.get(old_value)
+        if postings is not None:
+            postings.pop(rid, None)
+            if not postings:
                 m.pop(old_value, None)
+                self.ordered[column_number].delete(old_value)
 
-        # add to new list
-        m.setdefault(new_value, []).append(rid)
\ No newline at end of file
+        # add to new posting set
+        if new_value not in m:
+            self.ordered[column_number].insert(new_value, None)
+            self._probe_hashes = None
+        m.setdefault(new_value, {})[rid] = None
\ No newline at end of file
@@ -4,78 +4,151 @@ LockManager: Two-Phase Locking with no-wait policy for concurrency control.
 Maintains per-RID shared/exclusive locks. Multiple transactions can hold shared locks;
 only one can hold exclusive. Supports lock upgrade (S to X) if transaction is sole holder.
 Raises LockException immediately on conflict (no blocking).
+
+The lock table is striped: RIDs hash into LOCK_SHARDS partitions, each with its
+own mutex, so transactions touching disjoint RIDs do not serialize on one lock.
+
+Each lock entry is a (shared_mask, exclusive_slot) tuple. Transactions get a small
+slot number on first acquire; bit 'slot' of shared_mask marks a shared holder and
+exclusive_slot is the writer's slot (or NO_SLOT). Slots are recycled on release, so
+masks stay within a machine word while fewer than 64 transactions hold locks.
 """
 
+import heapq
 import threading
-from collections import defaultdict
+
+
+LOCK_SHARDS = 64  # power of two so the shard is a mask of the RID hash
+NO_SLOT = -1
+_FREE = (0, NO_SLOT)  # state of an RID nobody has locked; never stored
 
 
 class LockManager:
     def __init__(self):
-        self._lock = threading.Lock()  # Global lock for thread-safe access
-        self._locks = defaultdict(lambda: {'shared': set(), 'exclusive': None})  # RID -> lock state
+        self._N = LOCK_SHARDS
+        # Per shard: RID -> (shared_mask, exclusive_slot), guarded by that shard's mutex.
+        # Plain dicts: an entry exists only while some transaction holds the RID.
+        self._locks = [{} for _ in range(self._N)]
+        self._mutexes = [threading.Lock() for _ in range(self._N)]
+        # txn_id -> RIDs it holds any lock on; a txn only touches its own set
+        self._held = {}
+        # txn slot bookkeeping (guarded by _slot_lock)
+        self._slot_lock = threading.Lock()
+        self._slot_of = {}      # txn_id -> slot
+        self._txn_of = {}       # slot -> txn_id (for error messages)
+        self._free_slots = []   # min-heap of released slots
+        self._next_slot = 0
+
+    def _shard(self, rid):
+        """Index of the lock-table partition that owns 'rid'."""
+        return hash(rid) & (self._N - 1)
+
+    def _note_held(self, txn_id, rid):
+        """Record that txn_id now holds a lock on rid (explicit create, no defaultdict)."""
+        held = self._held.get(txn_id)
+        if held is None:
+            held = self._held[txn_id] = set()
+        held.add(rid)
+
+    def _slot(self, txn_id):
+        """Slot number for txn_id, assigning the lowest free one on first use."""
+        slot = self._slot_of.get(txn_id)
+        if slot is not None:
+            return slot
+        with self._slot_lock:
+            if self._free_slots:
+                slot = heapq.heappop(self._free_slots)
+            else:
+                slot = self._next_slot
+                self._next_slot += 1
+            self._slot_of[txn_id] = slot
+            self._txn_of[slot] = txn_id
+        return slot
     
     def acquire_shared(self, txn_id, rid):
         """Acquire shared lock on RID. Multiple transactions can hold shared locks."""
-        with self._lock:
-            entry = self._locks[rid]
+        slot = self._slot(txn_id)
+        bit = 1 << slot
+        s = self._shard(rid)
+        with self._mutexes[s]:
+            locks = self._locks[s]
+            mask, excl = locks.get(rid, _FREE)
             
             # Already holding shared or exclusive on this RID
-            if txn_id in entry['shared'] or entry['exclusive'] == txn_id:
+            if mask & bit or excl == slot:
                 return
             
             # Exclusive lock held by another transaction
-            if entry['exclusive'] is not None:
-                raise LockException(f"Txn {txn_id}: Cannot get S on {rid}, X held by {entry['exclusive']}")
+            if excl != NO_SLOT:
+                raise LockException(f"Txn {txn_id}: Cannot get S on {rid}, X held by {self._txn_of.get(excl)}")
             
             # Grant shared lock
-            entry['shared'].add(txn_id)
+            locks[rid] = (mask | bit, NO_SLOT)
+            self._note_held(txn_id, rid)
     
     def acquire_exclusive(self, txn_id, rid):
         """Acquire exclusive lock on RID. Only one transaction can hold exclusive."""
-        with self._lock:
-            entry = self._locks[rid]
+        slot = self._slot(txn_id)
+        bit = 1 << slot
+        s = self._shard(rid)
+        with self._mutexes[s]:
+            locks = self._locks[s]
+            mask, excl = locks.get(rid, _FREE)
             
             # Already holding exclusive on this RID
-            if entry['exclusive'] == txn_id:
+            if excl == slot:
                 return
             
             # Upgrade from shared to exclusive (only if sole holder)
-            if txn_id in entry['shared']:
-                if len(entry['shared']) == 1:
-                    entry['shared'].remove(txn_id)
-                    entry['exclusive'] = txn_id
-                    return
+            if mask & bit:
+                if mask == bit:
+                    locks[rid] = (0, slot)
+                    return  # already in _held from the shared grant
                 else:
                     raise LockException(f"Txn {txn_id}: Cannot upgrade on {rid}, others hold S")
             
             # Any other locks present (shared or exclusive)
-            if entry['shared'] or entry['exclusive'] is not None:
+            if mask or excl != NO_SLOT:
                 raise LockException(f"Txn {txn_id}: Cannot get X on {rid}, locks held")
             
             # Grant exclusive lock
-            entry['exclusive'] = txn_id
+            locks[rid] = (0, slot)
+            self._note_held(txn_id, rid)
     
     def release_all(self, txn_id):
         """Release all locks held by txn_id (on commit/abort)."""
-        with self._lock:
-            rids_to_delete = []
-            for rid, entry in self._locks.items():
-                # Remove transaction from shared set
-                entry['shared'].discard(txn_id)
-                
-                # Clear exclusive lock if held by this transaction
-                if entry['exclusive'] == txn_id:
-                    entry['exclusive'] = None
-                
+        held = self._held.pop(txn_id, ())
+        slot = self._slot_of.get(txn_id)
+        if slot is None:
+            return
+        keep = ~(1 << slot)
+
+        # Only visit the RIDs this transaction actually locked: O(held), not O(table)
+        for rid in held:
+            s = self._shard(rid)
+            with self._mutexes[s]:
+                locks = self._locks[s]
+                entry = locks.get(rid)
+                if entry is None:
+                    continue
+
+                # Remove transaction from shared mask; clear exclusive if it is ours
+                mask = entry[0] & keep
+                excl = NO_SLOT if entry[1] == slot else entry[1]
+
                 # Cleanup empty lock entries
-                if not entry['shared'] and entry['exclusive'] is None:
-                    rids_to_delete.append(rid)
-            
-            for rid in rids_to_delete:
-                del self._locks[rid]
+                if mask or excl != NO_SLOT:
+                    locks[rid] = (mask, excl)
+                else:
+                    del locks[rid]
+
+        # Slot is free for reuse only once none of our bits remain in the table
+        with self._slot_lock:
+            del self._slot_of[txn_id]
+            del self._txn_of[slot]
+            heapq.heappush(self._free_slots, slot)
 
 
 class LockException(Exception):
     """Raised when lock cannot be acquired (no-wait policy)."""
-    pass
\ No newline at end of file
+    pass
@@ -1,4 +1,40 @@
 from lstore import config
+import array
+import functools
+import json
+import struct
+import sys
+
+# Binary page file: header (num_records, len(page_id)) + UTF-8 page id + int64 cells (little-endian)
+_PAGE_HEADER = struct.Struct('<IH')
+_SWAP_CELLS = sys.byteorder != 'little'
+
+@functools.lru_cache(maxsize=1 << 16)
+def parse_page_id(s: str):
+    """
+    Split an underscore page id into its typed parts (memoized).
+
+    The same few thousand ids are parsed over and over on page loads and
+    writebacks, so the split + int conversions are done once per id.
+
+    Args:
+        s (str): "<table>_<col>_<page>_<isBase(0|1)>"
+
+    Returns:
+        tuple[str, int, int, bool]: (table_name, column_index, page_number, is_base_page)
+
+    Raises:
+        ValueError: If the string is not in the expected 4-part format.
+    """
+    parts = s.split('_')
+    if len(parts) != 4:
+        raise ValueError("Invalid PageID format")
+    return parts[0], int(parts[1]), int(parts[2]), bool(int(parts[3]))
+
+
+# is_base_page spellings seen in page ids / JSON -> bool (True/False hash like 1/0)
+_BOOL_MAP = {"0": False, "1": True, 0: False, 1: True}
+
 
 class PageID:
     """
@@ -12,7 +48,11 @@ class PageID:
         column_index (int): Physical column index (meta come first).
         page_number (int): Zero-based page sequence within that column.
         is_base_page (bool): True for base pages, False for tail pages.
+
+    PageIDs are treated as immutable once built, so the string form is formatted
+    once and cached.
     """
+    __slots__ = ("table_name", "column_index", "page_number", "is_base_page", "_str")
 
     def __init__(self, table_name, column_index, page_number, is_base_page):
         """
@@ -27,17 +67,20 @@ class PageID:
         self.table_name = str(table_name)
         self.column_index = int(column_index)
         self.page_number = int(page_number)
-        # accept "0"/"1", bool, or int for compatibility
-        if isinstance(is_base_page, str):
-            self.is_base_page = bool(int(is_base_page))
-        else:
-            self.is_base_page = bool(is_base_page)
+        # accept "0"/"1", bool, or int for compatibility; one dict probe for the usual forms
+        flag = _BOOL_MAP.get(is_base_page)
+        if flag is None:
+            flag = bool(int(is_base_page)) if isinstance(is_base_page, str) else bool(is_base_page)
+        self.is_base_page = flag
+        self._str = None
 
     def __str__(self):
         """
         Return the canonical underscore string form used for filenames.
         """
-        return f"{self.table_name}_{self.column_index}_{self.page_number}_{int(self.is_base_page)}"
+        if self._str is None:
+            self._str = f"{self.table_name}_{self.column_index}_{self.page_number}_{int(self.is_base_page)}"
+        return self._str
 
     @classmethod
     def parse(cls, s: str):
@@ -53,11 +96,7 @@ class PageID:
         Raises:
             ValueError: If the string is not in the expected 4-part format.
         """
-        parts = s.split('_')
-        if len(parts) != 4:
-            raise ValueError("Invalid PageID format")
-        t, c, p, b = parts
-        return cls(t, int(c), int(p), bool(int(b)))
+        return cls(*parse_page_id(s))
 
 
 class Page:
@@ -72,17 +111,22 @@ class Page:
     Attributes:
         PageID (PageID|str|None): Optional identifier; persisted via toJSON().
         num_records (int): Current number of valid entries on this page.
-        data (list[int]): Slot array storing integer values.
+        data (array.array): Preallocated int64 ('q') slot buffer of
+                            MAX_RECORDS_PER_PAGE cells; only the first
+                            num_records are meaningful.
     """
+    # Pages are created and touched per cell on every insert/update; fixed slots
+    # make attribute access a direct offset instead of an instance-dict lookup.
+    __slots__ = ("PageID", "num_records", "data")
 
     def __init__(self):
         """
-        Initialize an empty in-memory page. The 'data' list grows via 'write()'.
+        Initialize an empty in-memory page with a zeroed, fixed-capacity int64 buffer.
         """
         self.PageID = None
         self.num_records = 0
-        # don't preallocate with [] * N (it's still []); append on write
-        self.data = []
+        # one contiguous int64 buffer per page; writes are a single typed store
+        self.data = array.array('q', bytes(8 * config.MAX_RECORDS_PER_PAGE))
 
     def has_capacity(self) -> bool:
         """
@@ -98,19 +142,42 @@ class Page:
         Append a single integer to the end of the page.
 
         Args:
-            value (int): The integer value to store in the next free slot.
+            value (int): The integer value to store in the next free slot;
+                         anything int() accepts (e.g. "2", 2.0) is coerced.
 
         Returns:
             int: The slot index where the value was written.
 
         Raises:
             OverflowError: If the page has no remaining capacity.
+            TypeError, ValueError: If 'value' cannot be converted to an int
+                                   (the page is left unchanged).
         """
-        if not self.has_capacity():
+        slot = self.num_records
+        if slot >= config.MAX_RECORDS_PER_PAGE:
             raise OverflowError("Page is full")
-        self.num_records += 1
-        self.data.append(int(value))
-        return self.num_records - 1  # slot index
+        self.data[slot] = value if type(value) is int else int(value)
+        self.num_records = slot + 1
+        return slot
+
+    def write_many(self, values) -> int:
+        """
+        Append as many of 'values' as fit into the page with one slice copy.
+
+        Args:
+            values (Sequence[int]): Integers to append in order.
+
+        Returns:
+            int: Number of values written (may be less than len(values) when the
+                 page fills up; the caller continues on a fresh page).
+        """
+        start = self.num_records
+        n = min(len(values), config.MAX_RECORDS_PER_PAGE - start)
+        if n <= 0:
+            return 0
+        self.data[start:start + n] = array.array('q', values[:n])
+        self.num_records = start + n
+        return n
 
     def read(self, slot: int) -> int:
         """
@@ -141,7 +208,7 @@ class Page:
         return {
             "PageID": str(self.PageID) if self.PageID is not None else None,
             "num_records": self.num_records,
-            "data": self.data
+            "data": self.data[:self.num_records].tolist()
         }
 
     def fromJSON(self, json_data: dict) -> None:
@@ -158,8 +225,49 @@ class Page:
         pid = json_data.get("PageID")
         self.PageID = PageID.parse(pid) if pid is not None else None
         self.num_records = int(json_data["num_records"])
-        # ensure ints
-        self.data = [int(x) for x in json_data["data"]]
+        # copy the stored cells into the front of the preallocated buffer
+        values = json_data["data"]
+        self.data[:len(values)] = array.array('q', values)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the page into the compact binary file format.
+
+        Cells are copied straight out of the int64 buffer (no per-int string
+        formatting), so a full page is 8 bytes per slot plus a short header.
+
+        Returns:
+            bytes: Header + page id + the first num_records cells.
+        """
+        pid = str(self.PageID).encode() if self.PageID is not None else b""
+        cells = self.data[:self.num_records]
+        if _SWAP_CELLS:
+            cells.byteswap()
+        return _PAGE_HEADER.pack(self.num_records, len(pid)) + pid + cells.tobytes()
+
+    @classmethod
+    def from_bytes(cls, buf) -> "Page":
+        """
+        Load a page from bytes produced by 'to_bytes()'.
+
+        Args:
+            buf (bytes): Serialized page.
+
+        Returns:
+            Page: A new Page instance.
+        """
+        num_records, pid_len = _PAGE_HEADER.unpack_from(buf, 0)
+        off = _PAGE_HEADER.size
+        p = cls()
+        if pid_len:
+            p.PageID = PageID.parse(bytes(buf[off:off + pid_len]).decode())
+        off += pid_len
+        cells = array.array('q', buf[off:off + 8 * num_records])
+        if _SWAP_CELLS:
+            cells.byteswap()
+        p.data[:num_records] = cells
+        p.num_records = num_records
+        return p
 
     # --- compatibility aliases for buffer implementations expecting these names ---
 
@@ -190,4 +298,78 @@ class Page:
             self.data[slot] = value
         else:
             raise IndexError("Slot index out of bounds")
-  
\ No newline at end of file
+  
+
+
+def read_page_file(stem):
+    """
+    Load the page stored at '<stem><PAGE_FILE_SUFFIX>' (binary).
+
+    Falls back to a legacy '<stem><LEGACY_PAGE_FILE_SUFFIX>' JSON file written
+    before the binary format, so existing databases still open.
+
+    Args:
+        stem (str): Path without suffix, i.e. DATA_DIR/<table>/<page_id>.
+
+    Returns:
+        Page | None: The loaded page, or None if neither file exists.
+    """
+    try:
+        with open(stem + getattr(config, "PAGE_FILE_SUFFIX", ".page"), 'rb') as f:
+            return _read_binary_page(f)
+    except FileNotFoundError:
+        pass
+    try:
+        with open(stem + getattr(config, "LEGACY_PAGE_FILE_SUFFIX", ".page.json"), 'rb') as f:
+            page = Page()
+            page.fromJSON(json.loads(f.read()))
+            return page
+    except FileNotFoundError:
+        return None
+
+
+def _read_binary_page(f):
+    """
+    Read a binary page file straight into a fresh Page's int64 buffer.
+
+    Same format as Page.from_bytes(), but the cells are read with readinto()
+    directly into the preallocated buffer instead of through an intermediate
+    bytes object and array copy.
+
+    Args:
+        f (BinaryIO): File positioned at the start of the page file.
+
+    Returns:
+        Page: The loaded page.
+    """
+    num_records, pid_len = _PAGE_HEADER.unpack(f.read(_PAGE_HEADER.size))
+    p = Page()
+    if pid_len:
+        p.PageID = PageID.parse(f.read(pid_len).decode())
+    if num_records:
+        f.readinto(memoryview(p.data)[:num_records].cast('B'))
+        if _SWAP_CELLS:
+            p.data.byteswap()
+    p.num_records = num_records
+    return p
+
+
+def write_page_file(stem, page):
+    """
+    Persist 'page' to '<stem><PAGE_FILE_SUFFIX>' in the binary format.
+
+    The header and the cell buffer are written separately, so the int64 slots
+    go to the file without being copied into one concatenated bytes object.
+
+    Args:
+        stem (str): Path without suffix, i.e. DATA_DIR/<table>/<page_id>.
+        page (Page): Page to write.
+    """
+    pid = str(page.PageID).encode() if page.PageID is not None else b""
+    cells = memoryview(page.data)[:page.num_records]
+    if _SWAP_CELLS:
+        cells = page.data[:page.num_records]
+        cells.byteswap()
+    with open(stem + getattr(config, "PAGE_FILE_SUFFIX", ".page"), 'wb') as f:
+        f.write(_PAGE_HEADER.pack(page.num_records, len(pid)) + pid)
+        f.write(cells)
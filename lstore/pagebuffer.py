@@ -1,7 +1,9 @@
-from lstore.page import Page
+from lstore.page import Page, parse_page_id, read_page_file, write_page_file
 from lstore import config
-import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import threading
 
 
 class pageInBuffer:
@@ -12,13 +14,15 @@ class pageInBuffer:
         page (Page):    The in-memory page object.
         is_dirty (bool):True if the page has been modified since load.
         is_pinned (bool):When True, the page is not eligible for eviction.
-        last_access_time (int): Monotonic tick used by LRU policy.
+
+    Recency is not stored here: Bufferpool.pages is kept in LRU order instead.
     """
-    def __init__(self, page: Page, is_dirty: bool, is_pinned: bool, last_access_time):
+    __slots__ = ("page", "is_dirty", "is_pinned")
+
+    def __init__(self, page: Page, is_dirty: bool, is_pinned: bool):
         self.page = page
         self.is_dirty = is_dirty
         self.is_pinned = is_pinned
-        self.last_access_time = last_access_time
 
 
 class Bufferpool:
@@ -29,7 +33,7 @@ class Bufferpool:
       • Serve pages by page_id via get_page(), loading on miss.
       • Track dirty/pinned state to control eviction.
       • Write pages back on flush/evict using Table hooks if available,
-        otherwise fallback to JSON files under DATA_DIR/<table>/.
+        otherwise fallback to page files under DATA_DIR/<table>/.
 
     Notes:
       • Page identifiers use the underscore form: "<table>_<col>_<pageNo>_<isBase(0|1)>".
@@ -47,8 +51,33 @@ class Bufferpool:
         # Prefer team’s BUFFERPOOL_SIZE; keep a fallback name for compatibility.
         self.size = getattr(config, "BUFFERPOOL_SIZE",
                             getattr(config, "BUFFER_POOL_PAGES", 64))
-        self.pages = {}   # page_id -> pageInBuffer
-        self.clock = 0    # logical access counter for LRU
+        # page_id -> pageInBuffer, least- to most-recently used; hits move_to_end()
+        self.pages = OrderedDict()
+        self._table_cache = {}   # table name -> Table, filled on first page I/O
+        self._dirty_ids = set()  # ids of resident dirty frames, so flushes skip clean ones
+        self._io_executor = None    # writeback thread pool, created on first large flush
+        self._io_lock = threading.Lock()
+
+    def _table(self, name: str):
+        """
+        Resolve the owning Table for page I/O, memoized per name.
+
+        Raises:
+            ValueError: If the database has no such table (misses are not cached).
+        """
+        table = self._table_cache.get(name)
+        if table is None:
+            table = self._table_cache[name] = self.db.get_table(name)
+        return table
+
+    def invalidate_table_cache(self, name: str = None) -> None:
+        """
+        Forget cached Table handles (one name, or all) after tables are dropped.
+        """
+        if name is None:
+            self._table_cache.clear()
+        else:
+            self._table_cache.pop(name, None)
 
     def unpack_page_id(self, page_id: str):
         """
@@ -63,20 +92,16 @@ class Bufferpool:
         Raises:
             ValueError: If the identifier is not in the expected 4-part format.
         """
-        parts = page_id.split('_')
-        if len(parts) != 4:
-            raise ValueError("Invalid page ID format")
-        table_name = parts[0]
-        column_index = int(parts[1])
-        page_number = int(parts[2])
-        is_base_page = bool(int(parts[3]))
-        return table_name, column_index, page_number, is_base_page
+        try:
+            return parse_page_id(page_id)
+        except ValueError:
+            raise ValueError("Invalid page ID format") from None
 
     def get_page(self, page_id: str) -> Page:
         """
         Retrieve a page from the buffer pool (load on miss).
 
-        On hit: updates the frame's last_access_time and returns the in-memory page.
+        On hit: moves the frame to the MRU end and returns the in-memory page.
         On miss: evicts one victim if full, loads the page via _load_page(), installs
         a clean/unpinned frame, and returns it.
 
@@ -86,12 +111,13 @@ class Bufferpool:
         Returns:
             Page: The resident page object.
         """
-        self.clock += 1
-
         # Fast path: buffer hit
-        if page_id in self.pages:
-            pib = self.pages[page_id]
-            pib.last_access_time = self.clock
+        pib = self.pages.get(page_id)
+        if pib is not None:
+            try:
+                self.pages.move_to_end(page_id)
+            except KeyError:
+                pass  # evicted concurrently; the caller still gets the page object
             return pib.page
 
         # Miss: make space if needed, then load and install
@@ -99,29 +125,83 @@ class Bufferpool:
             self._evict_page()
 
         page = self._load_page(page_id)
-        self.pages[page_id] = pageInBuffer(
+        # setdefault: if another thread installed this page while we were loading,
+        # keep its frame (it may already hold writes) instead of overwriting it
+        pib = self.pages.setdefault(page_id, pageInBuffer(
             page=page,
             is_dirty=False,
-            is_pinned=False,
-            last_access_time=self.clock
-        )
-        return page
+            is_pinned=False
+        ))
+        return pib.page
+
+    def get_pages(self, page_ids) -> list:
+        """
+        Retrieve several pages at once (e.g. every column of one record).
+
+        Hits are resolved in a single pass; each distinct miss is then loaded
+        and installed in turn with the usual eviction.
+
+        Args:
+            page_ids (list[str]): Canonical underscore page identifiers.
+
+        Returns:
+            list[Page]: Pages in the same order as 'page_ids'.
+        """
+        pages = self.pages
+        # All-hit fast path (the common case): one comprehension, then LRU touch
+        try:
+            result = [pages[page_id].page for page_id in page_ids]
+        except KeyError:
+            result = None
+        if result is not None:
+            move_to_end = pages.move_to_end
+            try:
+                for page_id in page_ids:
+                    move_to_end(page_id)
+            except KeyError:
+                pass  # evicted concurrently; the caller still gets the page objects
+            return result
+
+        found = {}
+        misses = []
+        for page_id in page_ids:
+            if page_id in found:
+                continue
+            pib = pages.get(page_id)
+            if pib is None:
+                found[page_id] = None
+                misses.append(page_id)
+                continue
+            found[page_id] = pib.page
+            try:
+                pages.move_to_end(page_id)
+            except KeyError:
+                pass  # evicted concurrently; the caller still gets the page object
+
+        # misses are a handful of small page files (one row's columns), loaded in
+        # turn: spinning up threads per call costs far more than these reads
+        for page_id in misses:
+            page = self._load_page(page_id)
+            if len(pages) >= self.size:
+                self._evict_page()
+            pib = pages.setdefault(page_id, pageInBuffer(page=page, is_dirty=False, is_pinned=False))
+            found[page_id] = pib.page
+
+        return [found[page_id] for page_id in page_ids]
 
     # ---------------- internal I/O helpers ----------------
 
     def _page_path(self, table_name: str, column_index: int, page_number: int, is_base_page: bool) -> Path:
         """
-        Compute the filesystem path for a page JSON file under DATA_DIR/<table>/.
+        Compute the filesystem path (without file suffix) for a page under DATA_DIR/<table>/.
 
         Returns:
-            Path: Fully qualified path to the page JSON file.
+            Path: DATA_DIR/<table>/<page_id>; the page file helpers add the suffix.
         """
         data_dir = Path(getattr(config, "DATA_DIR", "data"))
         tdir = data_dir / table_name
         tdir.mkdir(parents=True, exist_ok=True)
-        suffix = getattr(config, "PAGE_FILE_SUFFIX", ".page.json")
-        fname = f"{table_name}_{column_index}_{page_number}_{int(is_base_page)}{suffix}"
-        return tdir / fname
+        return tdir / f"{table_name}_{column_index}_{page_number}_{int(is_base_page)}"
 
     def _load_page(self, page_id: str) -> Page:
         """
@@ -138,19 +218,17 @@ class Bufferpool:
 
         # Preferred path: delegate to Table’s hook if present.
         try:
-            table = self.db.get_table(table_name)
+            table = self._table(table_name)
             if hasattr(table, "get_page"):
                 return table.get_page(page_id)
         except Exception:
             # fall through to file read
             pass
 
-        # Fallback: read JSON file or create an empty page
+        # Fallback: read the page file or create an empty page
         ppath = self._page_path(table_name, column_index, page_number, is_base_page)
-        if ppath.exists():
-            obj = json.loads(ppath.read_text())
-            p = Page()
-            p.fromJSON(obj)
+        p = read_page_file(str(ppath))
+        if p is not None:
             return p
 
         # new, empty page (caller will assign/track the id at a higher layer)
@@ -160,45 +238,67 @@ class Bufferpool:
 
     def _evict_page(self) -> None:
         """
-        Evict one page frame according to LRU, preferring clean frames.
+        Evict one page frame with Clean-First LRU (CFLRU).
+
+        The LRU end of the pool is the clean-first region: its first
+        config.CFLRU_WINDOW unpinned frames. Within that region a clean frame is
+        preferred, since dropping it costs no writeback.
 
         Policy:
-          1) Choose the least-recently used frame that is not pinned and clean.
-          2) If none, choose the least-recently used frame that is not pinned
-             (may be dirty; will be written back).
+          1) Choose the least-recently used clean, unpinned frame in the region.
+          2) If the region holds only dirty frames, choose the least-recently
+             used unpinned frame (written back before removal).
           3) If all frames are pinned, raise an exception.
 
         Side effects:
             Writes a dirty victim to disk before removal.
         """
-        oldest_time = float('inf')
-        victim_id = None
-
-        # First pass: clean & unpinned
-        for pid, pib in self.pages.items():
-            if (not pib.is_pinned and
-                not pib.is_dirty and
-                pib.last_access_time < oldest_time):
-                oldest_time = pib.last_access_time
-                victim_id = pid
-
-        # Second pass: allow dirty (still must be unpinned)
-        if victim_id is None:
-            oldest_time = float('inf')
-            for pid, pib in self.pages.items():
-                if (not pib.is_pinned and
-                    pib.last_access_time < oldest_time):
-                    oldest_time = pib.last_access_time
-                    victim_id = pid
+        try:
+            victim_id = self._pick_victim(self.pages.items())
+        except RuntimeError:
+            # another thread reordered the pool mid-walk (a hit's move_to_end);
+            # retry over a snapshot rather than fail the caller's page load
+            victim_id = self._pick_victim(list(self.pages.items()))
 
         if victim_id is None:
             raise Exception("No pages available for eviction - all pages are pinned")
 
-        victim = self.pages[victim_id]
+        victim = self.pages.get(victim_id)
+        if victim is None:
+            return  # another thread evicted it first; a frame was freed either way
         if victim.is_dirty:
             self.write_page_to_disk(victim_id, victim.page)
 
-        del self.pages[victim_id]
+        self.pages.pop(victim_id, None)
+        self._dirty_ids.discard(victim_id)
+
+    def _pick_victim(self, frames):
+        """
+        Walk (page_id, frame) pairs from the LRU end and pick a CFLRU victim.
+
+        The pool is walked in place, not copied, so an eviction only touches
+        the frames up to the end of the clean-first region.
+
+        Args:
+            frames (Iterable[tuple[str, pageInBuffer]]): Frames in LRU order.
+
+        Returns:
+            str | None: Victim page id, or None if every frame is pinned.
+        """
+        window = getattr(config, "CFLRU_WINDOW", self.size // 2) or 1
+        fallback_id = None
+        # Frames are in LRU order, so the first eligible frame is the oldest.
+        for pid, pib in frames:
+            if pib.is_pinned:
+                continue
+            if not pib.is_dirty:
+                return pid               # 1) oldest clean & unpinned
+            if fallback_id is None:
+                fallback_id = pid        # 2) oldest unpinned (dirty)
+            window -= 1
+            if window <= 0:
+                break                    # past the clean-first region
+        return fallback_id
 
     # ---------------- pin/dirty API ----------------
 
@@ -220,8 +320,15 @@ class Bufferpool:
         """
         Mark a resident page as dirty (must be written back before eviction).
         """
-        if page_id in self.pages:
-            self.pages[page_id].is_dirty = True
+        pib = self.pages.get(page_id)
+        if pib is not None:
+            pib.is_dirty = True
+            self._dirty_ids.add(page_id)
+
+    def _mark_clean(self, page_id: str, pib: "pageInBuffer") -> None:
+        """Record that a frame's contents now match what is on disk."""
+        pib.is_dirty = False
+        self._dirty_ids.discard(page_id)
 
     # ---------------- writeback ----------------
 
@@ -230,7 +337,7 @@ class Bufferpool:
         Persist a page to disk.
 
         Preferred path: call the owning Table's write_page() if available.
-        Fallback: write JSON to DATA_DIR/<table>/<page_id>.page.json.
+        Fallback: write the binary page file to DATA_DIR/<table>/<page_id><PAGE_FILE_SUFFIX>.
 
         Args:
             page_id (str): Canonical underscore page identifier.
@@ -240,29 +347,130 @@ class Bufferpool:
 
         # Delegate to Table’s hook if implemented
         try:
-            table = self.db.get_table(table_name)
+            table = self._table(table_name)
             if hasattr(table, "write_page"):
                 table.write_page(page_id, page)
                 return
         except Exception:
             pass
 
-        # Fallback: direct JSON write
+        # Fallback: direct file write
         ppath = self._page_path(table_name, column_index, page_number, is_base_page)
-        ppath.write_text(json.dumps(page.toJSON()))
+        write_page_file(str(ppath), page)
+
+    def _dirty_in_disk_order(self, prefix: str = ""):
+        """
+        Collect dirty frames (optionally only page ids starting with 'prefix') sorted
+        by (table, column, base/tail, page number).
+
+        Sorting the numeric parts (not the raw id string, where "_10_" sorts before
+        "_2_") makes writeback walk each column's files in page order, so
+        consecutive writes land in the same directory region instead of hash order.
+
+        Returns:
+            list[tuple[str, pageInBuffer]]: (page_id, frame) pairs in flush order.
+        """
+        dirty = []
+        for pid in list(self._dirty_ids):  # O(dirty), not O(resident)
+            if not pid.startswith(prefix):
+                continue
+            pib = self.pages.get(pid)
+            if pib is None or not pib.is_dirty:
+                self._dirty_ids.discard(pid)
+                continue
+            dirty.append((pid, pib))
+        dirty.sort(key=lambda kv: self._flush_order_key(kv[0]))
+        return dirty
+
+    def _flush_order_key(self, page_id: str):
+        """Sort key for writeback; ids that do not parse go last in string order."""
+        try:
+            table_name, column_index, page_number, is_base_page = self.unpack_page_id(page_id)
+        except ValueError:
+            return (1, page_id, 0, 0, 0)
+        return (0, table_name, column_index, not is_base_page, page_number)
+
+    def flush_table(self, table_name: str) -> None:
+        """
+        Write the dirty pages belonging to one table out to disk and mark them clean.
+
+        Frames of different tables are disjoint, so Database.close() may run this
+        for several tables concurrently.
+        """
+        for pid, pib in self._dirty_in_disk_order(f"{table_name}_"):
+            self.write_page_to_disk(pid, pib.page)
+            self._mark_clean(pid, pib)
+
+    def _batch_writeback(self, victims) -> None:
+        """
+        Write a batch of (page_id, frame) pairs and mark them clean.
+
+        Every page is its own file, so the writes are independent; large
+        batches are spread over the pool's long-lived writeback executor to
+        overlap their open/serialize/write latency. Batches of at most
+        config.WRITEBACK_INLINE_MAX pages are written inline, where thread
+        hand-off would cost more than it saves.
+
+        Args:
+            victims (list[tuple[str, pageInBuffer]]): Frames to write back.
+        """
+        def _write(item):
+            pid, pib = item
+            self.write_page_to_disk(pid, pib.page)
+            self._mark_clean(pid, pib)
+
+        if len(victims) <= getattr(config, "WRITEBACK_INLINE_MAX", 16):
+            for item in victims:
+                _write(item)
+            return
+        list(self._writeback_executor().map(_write, victims))
+
+    def _writeback_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the pool's writeback executor, creating it on first use.
+
+        One executor is reused for every flush instead of spinning up threads
+        per call; shutdown() releases it (Database.close() calls it).
+
+        Returns:
+            ThreadPoolExecutor: Shared executor with up to 8 workers.
+        """
+        ex = self._io_executor
+        if ex is None:
+            with self._io_lock:
+                if self._io_executor is None:
+                    self._io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="lstore-writeback")
+                ex = self._io_executor
+        return ex
+
+    def shutdown(self) -> None:
+        """
+        Stop the writeback executor's threads, if one was started.
+
+        The pool stays usable: a later large flush starts a fresh executor.
+        """
+        with self._io_lock:
+            ex, self._io_executor = self._io_executor, None
+        if ex is not None:
+            ex.shutdown(wait=True)
 
     def flush_all(self) -> None:
         """
-        Write all dirty pages out to disk and mark them clean.
+        Write all dirty pages out to disk, in on-disk order, and mark them clean.
         """
-        for pid, pib in self.pages.items():
-            if pib.is_dirty:
-                self.write_page_to_disk(pid, pib.page)
-                pib.is_dirty = False
+        self._batch_writeback(self._dirty_in_disk_order())
 
     def evict_all(self) -> None:
         """
-        Evict frames until the buffer pool is empty, flushing dirty pages as needed.
+        Evict every unpinned frame, writing the dirty ones back as one batch.
+
+        Raises:
+            Exception: If frames remain because they are pinned.
         """
-        while self.pages:
-            self._evict_page()
+        victims = [(pid, pib) for pid, pib in list(self.pages.items()) if not pib.is_pinned]
+        self._batch_writeback([(pid, pib) for pid, pib in victims if pib.is_dirty])
+        for pid, _ in victims:
+            self.pages.pop(pid, None)
+            self._dirty_ids.discard(pid)
+        if self.pages:
+            raise Exception("No pages available for eviction - all pages are pinned")
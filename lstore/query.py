@@ -1,6 +1,7 @@
 from lstore.table import Table, Record
 from lstore.index import Index
 from lstore import config
+from lstore.config import META_COLUMNS as _META, SCHEMA_ENCODING_COLUMN as _SCH
 from lstore.lock_manager import LockException
 
 # M3: Helper function to get current transaction ID from thread-local storage
@@ -27,6 +28,13 @@ class Query:
         """
         self.table = table
         self.index: Index = table.index
+        # resolved once: the PK column and the per-column index slots (the list
+        # itself; slots are re-read per call since indexes are created lazily)
+        self._key = int(table.key)
+        self._indices = self.index.indices
+        # PK -> base RID found by the fallback scan (PK and RID never change for
+        # a row; hits are re-checked against the deleted set before use)
+        self._pk_cache = {}
 
     # ---------------- helpers ----------------
 
@@ -57,55 +65,42 @@ class Query:
         if isinstance(projected_columns_index, list):
             if len(projected_columns_index) == n:
                 return projected_columns_index
-            if len(projected_columns_index) == n + config.META_COLUMNS:
-                return projected_columns_index[config.META_COLUMNS:]
+            if len(projected_columns_index) == n + _META:
+                return projected_columns_index[_META:]
         return [1] * n
 
     def _pk_to_rid(self, pk):
         """
         Resolve the base RID for primary key `pk`.
-        Uses PK index if present; otherwise scans the page_directory's PK cell directly.
+        Uses PK index if present; otherwise scans the base PK column block-wise.
+        An index miss is final unless config.ROBUST_PK_SCAN is set.
         Never returns a tail RID and ignores logically deleted rows.
         """
-        deleted = getattr(self.table, "deleted", set())
-
-        # Fast path: PK index
-        try:
-            d = self.index.indices[self.table.key]
-            if d is not None:
-                hits = d.get(pk)
-                if hits:
-                    rid = hits[0]
-                    return rid if rid not in deleted else None
-        except Exception:
-            pass
-
-        # Fallback: scan base rows' PK cell
-        key_col = config.META_COLUMNS + self.table.key
-        for rid, locs in self.table.page_directory.items():
-            # only base rows
-            try:
-                if isinstance(rid, str):
-                    if not rid.startswith('b'):
-                        continue
-                else:
-                    # int RID: base if < TAIL_RID_START (when defined)
-                    if int(rid) >= getattr(config, "TAIL_RID_START", 10**9):
-                        continue
-            except Exception:
-                continue
-
-            if rid in deleted:
-                continue
-            if not locs or len(locs) <= key_col or not locs[key_col]:
-                continue
-
-            pid, slot = locs[key_col]
-            try:
-                if self.table.pageBuffer.get_page(pid).read(slot) == pk:
-                    return rid
-            except Exception:
-                continue
+        deleted = self.table.deleted
+
+        # Fast path: PK index (postings are singleton lists)
+        d = self._indices[self._key]
+        if d is not None:
+            hits = d.get(pk)
+            if hits:
+                rid = hits[0]
+                return None if rid in deleted else rid
+            if not getattr(config, "ROBUST_PK_SCAN", False):
+                return None  # the PK index is authoritative: a miss is a miss
+
+        # Memoized result of an earlier scan for this key
+        rid = self._pk_cache.get(pk)
+        if rid is not None:
+            if rid not in deleted:
+                return rid
+            del self._pk_cache[pk]  # row was deleted since; rescan
+
+        # Fallback: scan base rows' PK cell block-wise (base RIDs only, RID order)
+        key_col = config.META_COLUMNS + self._key
+        for rid in self.table._scan_base_column_eq(key_col, pk):
+            if rid not in deleted:
+                self._pk_cache[pk] = rid
+                return rid
         return None
 
     def _is_base_rid(self, rid):
@@ -152,7 +147,7 @@ class Query:
 
     def _get_version_rid(self, base_rid, relative_version: int):
         """
-        Walk the version chain to a relative version.
+        Resolve a relative version to the RID holding it.
 
         Convention: 0 = latest, -1 = previous, -2 = previous of previous, etc.
         The walk clamps at the base record if the chain runs out.
@@ -164,25 +159,15 @@ class Query:
         Returns:
             int|str: RID at the requested relative version.
         """
-        # Map a relative version to a RID by walking the indirection chain.
-        # 0 -> latest; -1 -> previous; ... ; clamps at base.
-        cur = self._get_latest_rid(base_rid)
+        # Map a relative version to a RID: 0 -> latest; -k -> k-th entry of the
+        # cached newest->oldest tail chain; clamps at base.
         if relative_version == 0:
-            return cur
-        steps = max(0, -int(relative_version))
-        for _ in range(steps):
-            if cur == base_rid:
-                break
-            pid, slot = self.table.page_directory[cur][config.INDIRECTION_COLUMN]
-            page = self.table.pageBuffer.get_page(pid)
-            prev = page.read(slot)
-            if prev == 0:
-                cur = base_rid
-                break
-            cur = prev
-        return cur
+            return self._get_latest_rid(base_rid)
+        chain = self._collect_tail_chain(base_rid)
+        k = max(0, -int(relative_version))
+        return chain[k] if k < len(chain) else base_rid
 
-    def _latest_user_values(self, base_rid):
+    def _latest_user_values(self, base_rid, proj=None):
         """
         Materialize the latest full user-row for a base record.
 
@@ -191,21 +176,16 @@ class Query:
 
         Args:
             base_rid (int|str): RID of the base record.
+            proj (list[int] | None): Optional projection mask; unprojected
+                columns are skipped (returned as None) by the Table helper.
 
         Returns:
             list[int]: Current values of all user columns.
         """
-        # Materialize the latest full user-row.
+        # Materialize the latest user-row, reading only projected columns.
         if hasattr(self.table, "_materialize_latest_user_values"):
-            return self.table._materialize_latest_user_values(base_rid)
-        latest = self._get_latest_rid(base_rid)
-        vals = []
-        start = config.META_COLUMNS
-        for c in range(start, start + self.table.num_columns):
-            pid, slot = self.table.page_directory[latest][c]
-            page = self.table.pageBuffer.get_page(pid)
-            vals.append(page.read(slot))
-        return vals
+            return self.table._materialize_latest_user_values(base_rid, proj)
+        return self._read_user_values_from_rid(self._get_latest_rid(base_rid))
 
     def _read_user_values_from_rid(self, rid):
         """
@@ -217,13 +197,11 @@ class Query:
         Returns:
             list[int]: Values for all user columns at that version.
         """
-        vals = []
-        start = config.META_COLUMNS
-        for c in range(start, start + self.table.num_columns):
-            pid, slot = self.table.page_directory[rid][c]
-            page = self.table.pageBuffer.get_page(pid)
-            vals.append(page.read(slot))
-        return vals
+        locs = self.table.page_directory[rid][_META:_META + self.table.num_columns]
+        # resolve every column page in one bufferpool call, then index the
+        # int64 buffers directly (slots come from page_directory, so in range)
+        pages = self.table.pageBuffer.get_pages([pid for pid, _ in locs])
+        return [page.data[slot] for page, (_, slot) in zip(pages, locs)]
 
     def _make_records(self, rows, proj_mask):
         """
@@ -236,9 +214,17 @@ class Query:
         Returns:
             list[Record]: One Record per input row; Record.columns = user columns only.
         """
+        if all(proj_mask):
+            # full projection (the common case): Record copies the row as-is
+            return [Record(rid=None, key=None, columns=row) for row in rows]
+        # resolve the kept column indices once, not a mask test per cell
+        n = len(proj_mask)
+        keep = [i for i, m in enumerate(proj_mask) if m]
         out = []
         for row in rows:
-            cols = [(row[i] if proj_mask[i] else None) for i in range(self._num_user_cols())]
+            cols = [None] * n
+            for i in keep:
+                cols[i] = row[i]
             out.append(Record(rid=None, key=None, columns=cols))
         return out
 
@@ -262,11 +248,9 @@ class Query:
             if txn is not None:
                 txn.deleted_rids.append((self.table, rid))
             
-            idx = self.index.indices[self.table.key]
+            idx = self._indices[self._key]
             if idx and primary_key in idx:
                 idx.pop(primary_key, None)
-            if not hasattr(self.table, "deleted"):
-                self.table.deleted = set()
             self.table.deleted.add(rid)
             return True
         except LockException: # M3: Handle lock conflicts
@@ -282,20 +266,24 @@ class Query:
         the assignment's error-handling contract.
 
         Args:
-            *columns (int): Values for all user columns.
+            *columns (int): Values for all user columns (int-convertible).
 
         Returns:
             bool: True on success; False on failure.
         """
         try:
+            # ints pass straight through; anything else (e.g. "2", 2.0) is coerced
+            # once here, before any page or index is touched
+            values = columns if all(type(c) is int for c in columns) else list(map(int, columns))
+
             # Perform the insert first
-            result = self.table.insert_row(*columns)
+            result = self.table.insert_row(*values)
             
             # M3: After successful insert, acquire exclusive lock on the new RID
             if result:
                 txn_id = get_current_txn_id()
                 if txn_id is not None and hasattr(self.table, 'lock_manager'):
-                    pk_value = columns[self.table.key]
+                    pk_value = values[self._key]
                     new_rid = self._pk_to_rid(pk_value)
                     if new_rid is not None:
                         self.table.lock_manager.acquire_exclusive(txn_id, new_rid)
@@ -321,82 +309,66 @@ class Query:
         try:
             proj = self._proj(projected_columns_index)
             rows = []
-            deleted = getattr(self.table, "deleted", set())
+            deleted = self.table.deleted
             txn_id = get_current_txn_id()
 
             # ---------- Primary-key predicate ----------
-            if int(search_key_index) == int(self.table.key):
+            if int(search_key_index) == self._key:
                 rid = self._pk_to_rid(search_key)
                 if rid is not None and rid not in deleted:
                     # M3: Acquire shared lock for read
                     if txn_id is not None and hasattr(self.table, 'lock_manager'):
                         self.table.lock_manager.acquire_shared(txn_id, rid)
-                    rows.append(self._latest_user_values(rid))
+                    rows.append(self._latest_user_values(rid, proj))
                     return self._make_records(rows, proj)
 
-                # Robust fallback: scan base rows' key cell
-                key_col = config.META_COLUMNS + self.table.key
-                tail_start = getattr(config, "TAIL_RID_START", 10**9)
-                for br in self.table.page_directory.keys():
-                    # base only + not deleted
-                    if isinstance(br, str):
-                        if not br.startswith('b'):
-                            continue
-                    else:
-                        if int(br) >= tail_start:
-                            continue
-                    if br in deleted:
-                        continue
-                    loc = self.table.page_directory[br][key_col]
-                    if not loc:
-                        continue
-                    page_id, slot = loc
-                    page = self.table.pageBuffer.get_page(page_id)
-                    try:
-                        if page.read(slot) == search_key:
-                            rows.append(self._latest_user_values(br))
+                # Robust fallback: scan base rows' key cell block-wise (off by
+                # default; a PK-index miss returns [] without touching pages)
+                if getattr(config, "ROBUST_PK_SCAN", False):
+                    key_col = config.META_COLUMNS + self._key
+                    for br in self.table._scan_base_column_eq(key_col, search_key):
+                        if br not in deleted:
+                            rows.append(self._latest_user_values(br, proj))
                             break
-                    except Exception:
-                        continue
                 return self._make_records(rows, proj)
 
             # ---------- Non-PK predicate: try secondary index ----------
             rids_from_index = None
             try:
                 if 0 <= search_key_index < self.table.num_columns:
-                    idx_dict = self.index.indices[search_key_index]
+                    idx_dict = self._indices[search_key_index]
                     if idx_dict is not None:
                         rids_from_index = self.index.locate(search_key_index, search_key)
             except Exception:
                 rids_from_index = None  # fall back to scan
 
             if rids_from_index:
-                for rid in rids_from_index:
-                    if self._is_base_rid(rid) and rid not in deleted:
-                        # M3: Acquire shared lock for each record
-                        if txn_id is not None and hasattr(self.table, 'lock_manager'):
-                            self.table.lock_manager.acquire_shared(txn_id, rid)
-                        rows.append(self._latest_user_values(rid))
-                return self._make_records(rows, proj)
+                # index RIDs are ints (Index normalizes them): classify by one compare
+                tail_start = getattr(config, "TAIL_RID_START", 10**9)
+                hits = [rid for rid in rids_from_index
+                        if rid < tail_start and rid not in deleted]
+                # M3: Acquire shared lock for each record (all before any read)
+                if txn_id is not None and hasattr(self.table, 'lock_manager'):
+                    for rid in hits:
+                        self.table.lock_manager.acquire_shared(txn_id, rid)
+                # materialize the matches column-at-a-time
+                return self._make_records(self.table._latest_user_rows(hits, proj), proj)
 
             # ---------- Fallback: scan base records ----------
-            tail_start = getattr(config, "TAIL_RID_START", 10**9)
-            for rid in self.table.page_directory.keys():
-                if isinstance(rid, str):
-                    if not rid.startswith('b'):
-                        continue
-                else:
-                    if int(rid) >= tail_start:
-                        continue
-                if rid in deleted:
-                    continue
-                vals = self._latest_user_values(rid)
-                if vals[search_key_index] == search_key:
-                    # M3: Acquire shared lock for each matched record
-                    if txn_id is not None and hasattr(self.table, 'lock_manager'):
-                        self.table.lock_manager.acquire_shared(txn_id, rid)
-                    rows.append(vals)
-            return self._make_records(rows, proj)
+            # Match one column's latest values block-wise (C-level search on
+            # pages without updates), then materialize only the matching rows.
+            n = self._num_user_cols()
+            if not -n <= search_key_index < n:
+                return []
+            col = _META + (search_key_index % n)
+            hits = [rid for rid in self.table._scan_latest_column_eq(col, search_key)
+                    if rid not in deleted]
+            # M3: Acquire shared lock for each matched record
+            if txn_id is not None and hasattr(self.table, 'lock_manager'):
+                acquire_shared = self.table.lock_manager.acquire_shared
+                for rid in hits:
+                    acquire_shared(txn_id, rid)
+            return self._make_records(self.table._latest_user_rows(hits, proj), proj)
 
         except LockException: # M3: Handle lock conflicts
             return []
@@ -418,7 +390,7 @@ class Query:
         """
         try:
             # If not querying on PK, just delegate to regular select()
-            if int(search_key_index) != int(self.table.key):
+            if int(search_key_index) != self._key:
                 return self.select(search_key, search_key_index, projected_columns_index)
 
             # Normalize projection to user-column width
@@ -426,7 +398,7 @@ class Query:
 
             # Resolve base RID (skip logically deleted rows)
             base_rid = self._pk_to_rid(search_key)
-            if base_rid is None or base_rid in getattr(self.table, "deleted", set()):
+            if base_rid is None or base_rid in self.table.deleted:
                 return []
 
             # Compose the row at the requested relative version
@@ -447,7 +419,7 @@ class Query:
             if len(columns) != n:
                 return False
             rid = self._pk_to_rid(primary_key)
-            if rid is None or rid in getattr(self.table, "deleted", set()):
+            if rid is None or rid in self.table.deleted:
                 return False
             
             # M3: Acquire exclusive lock for update
@@ -455,28 +427,30 @@ class Query:
             if txn_id is not None and hasattr(self.table, 'lock_manager'):
                 self.table.lock_manager.acquire_exclusive(txn_id, rid)
 
-            # Capture old values and indirection before update for rollback
-            current = self._latest_user_values(rid)
-            prev_indirection = 0
-            try:
-                if rid in self.table.page_directory:
-                    pid, slot = self.table.page_directory[rid][config.INDIRECTION_COLUMN]
-                    page = self.table.pageBuffer.get_page(pid)
-                    prev_indirection = page.read(slot)
-                    if prev_indirection in (0, None):
-                        prev_indirection = 0
-            except:
+            # Capture old values and indirection before update, only when a
+            # transaction may need them for rollback
+            from lstore.transaction import get_current_transaction
+            txn = get_current_transaction()
+            if txn is not None:
+                current = self._latest_user_values(rid)
                 prev_indirection = 0
-            
-            filled = [current[i] if columns[i] is None else columns[i] for i in range(n)]
-            result = self.table.update_row(rid, *filled)
+                try:
+                    if rid in self.table.page_directory:
+                        pid, slot = self.table.page_directory[rid][config.INDIRECTION_COLUMN]
+                        page = self.table.pageBuffer.get_page(pid)
+                        prev_indirection = page.read(slot)
+                        if prev_indirection in (0, None):
+                            prev_indirection = 0
+                except:
+                    prev_indirection = 0
+
+            # update_row already treats None as "no change" against the latest row,
+            # so the columns go through as-is (no pre-filled copy of the row)
+            result = self.table.update_row(rid, *columns)
             
             # Track for rollback if successful
-            if result:
-                from lstore.transaction import get_current_transaction
-                txn = get_current_transaction()
-                if txn is not None:
-                    txn.updated_rids.append((self.table, rid, prev_indirection, current))
+            if result and txn is not None:
+                txn.updated_rids.append((self.table, rid, prev_indirection, current))
             
             return result
         except LockException: # M3: Handle lock conflicts
@@ -485,27 +459,45 @@ class Query:
             return False
 
     def sum(self, start_range, end_range, aggregate_column_index):
-        """SUM over PK range; respects logical deletes."""
+        """
+        SUM over PK range; respects logical deletes.
+
+        Only the aggregated column is read per row (latest RID + one cell) rather
+        than materializing the whole user row. Without a PK index the key range
+        is filtered block-wise over the base key pages (the PK never changes, so
+        base values are exact).
+        """
         try:
             s, e = int(start_range), int(end_range)
+            n = self._num_user_cols()
             col = int(aggregate_column_index)
+            if not -n <= col < n:
+                return False
+            agg_col = config.META_COLUMNS + (col % n)
+            table = self.table
+            deleted = table.deleted
             total = 0
 
-            if self.index.indices[self.table.key] is not None:
-                rids = self.index.locate_range(s, e, self.table.key)
+            if self._indices[self._key] is not None:
+                rids = self.index.locate_range(s, e, self._key)
+                tail_start = getattr(config, "TAIL_RID_START", 10**9)
                 for rid in rids:
-                    if not self._is_base_rid(rid) or (rid in getattr(self.table, "deleted", set())):
+                    if rid >= tail_start or rid in deleted:
                         continue
-                    total += int(self._latest_user_values(rid)[col])
+                    total += int(table._read_cell(table._get_latest_rid(rid), agg_col))
                 return total
 
-            for rid in self.table.page_directory.keys():
-                if not self._is_base_rid(rid) or (rid in getattr(self.table, "deleted", set())):
-                    continue
-                vals = self._latest_user_values(rid)
-                pk = vals[self.table.key]
-                if s <= pk <= e:
-                    total += int(vals[col])
+            # Column-at-a-time: walk the key, aggregate and INDIRECTION blocks of
+            # each base page together; only rows with a tail need a cell lookup
+            key_col = config.META_COLUMNS + self._key
+            blocks = zip(table._iter_base_blocks(key_col),
+                         table._iter_base_blocks(agg_col),
+                         table._iter_base_blocks(config.INDIRECTION_COLUMN))
+            for (first_rid, keys, count), (_, vals, _), (_, indir, _) in blocks:
+                for slot in range(count):
+                    if s <= keys[slot] <= e and (first_rid + slot) not in deleted:
+                        tail = indir[slot]
+                        total += vals[slot] if not tail else int(table._read_cell(tail, agg_col))
             return total
         except Exception:
             return False
@@ -521,28 +513,23 @@ class Query:
             col = int(aggregate_column_index)
             rv_in = int(relative_version)
             rv_index = (0 if rv_in >= 0 else -rv_in)  # 0->0, -1->1, -k->k
+            if rv_index == 0:
+                # latest version: same answer as sum(), which reads one cell per row
+                return self.sum(s, e, col)
             total = 0
-            deleted = getattr(self.table, "deleted", set())
+            deleted = self.table.deleted
 
             # Prefer PK index to get base RIDs in range
-            if self.index.indices[self.table.key] is not None:
-                base_rids = self.index.locate_range(s, e, self.table.key)
+            if self._indices[self._key] is not None:
+                base_rids = self.index.locate_range(s, e, self._key)
             else:
-                # Fallback: scan page_directory for base records, filter by PK value
+                # Fallback: filter the base key column block-wise by PK value
                 base_rids = []
-                tail_start = getattr(config, "TAIL_RID_START", 10**9)
-                key_col = config.META_COLUMNS + self.table.key
-                for rid, locs in self.table.page_directory.items():
-                    # base only
-                    if (isinstance(rid, str) and not rid.startswith('b')) or \
-                    (not isinstance(rid, str) and int(rid) >= tail_start):
-                        continue
-                    if rid in deleted:
-                        continue
-                    pid, slot = locs[key_col]
-                    pk_val = int(self.table.pageBuffer.get_page(pid).read(slot))
-                    if s <= pk_val <= e:
-                        base_rids.append(rid)
+                key_col = config.META_COLUMNS + self._key
+                for first_rid, data, count in self.table._iter_base_blocks(key_col):
+                    for slot, pk_val in enumerate(data[:count]):
+                        if s <= pk_val <= e and (first_rid + slot) not in deleted:
+                            base_rids.append(first_rid + slot)
 
             for br in base_rids:
                 if br in deleted:
@@ -558,6 +545,9 @@ class Query:
         """
         Convenience: increment a single user column by 1 (select -> update).
 
+        Only the target column is read, and the update goes through the normal
+        tail-append path so versioned reads still see the pre-increment value.
+
         Args:
             key (int): Primary key of the row to increment.
             column (int): 0-based user-column index to increment.
@@ -566,13 +556,14 @@ class Query:
             bool: True on success; False if select/update fails.
         """
         try:
-            res = self.select(key, self.table.key, [1] * self._num_user_cols())
+            n = self._num_user_cols()
+            only = [0] * n
+            only[column] = 1
+            res = self.select(key, self._key, only)
             if not res:
                 return False
-            cur = list(res[0].columns)
-            cur[column] = int(cur[column]) + 1
-            filled = [None] * self._num_user_cols()
-            filled[column] = cur[column]
+            filled = [None] * n
+            filled[column] = int(res[0].columns[column]) + 1
             return self.update(key, *filled)
         except Exception:
             return False
@@ -586,50 +577,25 @@ class Query:
         Implementation: tails are cumulative, so just fetch the RID k steps back
         and read its user columns directly.
         """
+        if int(relative_version) == 0:
+            return self._latest_user_values(base_rid)
         rid_at_version = self._get_version_rid(base_rid, int(relative_version))
         return self._read_user_values_from_rid(rid_at_version)
 
     def _ensure_tail_maps(self):
         """
-        Build one-time caches from page_directory so versioned reads are fast:
+        Bind the table's tail lineage caches so versioned reads are fast:
         _prev_cache[tail_rid] -> previous rid (tail or base)
         _ts_cache[tail_rid]   -> timestamp (int)
         _head_cache[base_rid] -> newest tail rid for that base (0 if none)
-        Safe to call many times; it only builds once.
+        The Table builds them from tail pages once and keeps them current on
+        every update, so they are never stale across queries.
         """
-        if hasattr(self, "_prev_cache"):
-            return
-        self._prev_cache = {}
-        self._ts_cache = {}
-        self._head_cache = {}
-
-        pd = self.table.page_directory
-        tail_start = getattr(config, "TAIL_RID_START", 10**9)
-
-        # collect prev/timestamp for all tails
-        for rid, locs in pd.items():
-            try:
-                is_tail = (int(rid) >= tail_start)
-            except Exception:
-                is_tail = isinstance(rid, str) and rid.startswith('t')
-            if not is_tail:
-                continue
-            pid_in, slot_in = locs[config.INDIRECTION_COLUMN]
-            self._prev_cache[rid] = int(self.table.pageBuffer.get_page(pid_in).read(slot_in))
-            pid_ts, slot_ts = locs[config.TIMESTAMP_COLUMN]
-            self._ts_cache[rid] = int(self.table.pageBuffer.get_page(pid_ts).read(slot_ts))
-
-        # compute newest head per base (by timestamp)
-        for t in list(self._prev_cache.keys()):
-            base = self._prev_cache[t]
-            # walk to base once; cheap due to memoization of _prev_cache for tails
-            while base in self._prev_cache:         # while 'base' is actually a tail
-                base = self._prev_cache[base]
-            if not base:
-                continue
-            cur_head = self._head_cache.get(base, 0)
-            if (not cur_head) or (self._ts_cache[t] > self._ts_cache.get(cur_head, -1)):
-                self._head_cache[base] = t
+        table = self.table
+        table._ensure_tail_maps()
+        self._prev_cache = table._prev_cache
+        self._ts_cache = table._ts_cache
+        self._head_cache = table._head_cache
 
 
     def _collect_tail_chain(self, base_rid):
@@ -674,6 +640,10 @@ class Query:
         NOTE: select_version/sum_version already convert relative_version (0,-1,-2,..)
         into this non-negative rv_index. Do NOT remap here.
         """
+        if rv_index == 0:
+            # newest version: tails are cumulative, so no chain walk is needed
+            return self._latest_user_values(base_rid)
+
         # start from base values
         row = self._read_user_values_from_rid(base_rid)
 
@@ -687,17 +657,26 @@ class Query:
             return row
 
         # Overlay from the chosen tail towards older tails until all cols are set.
+        # filled_mask has bit c set once column c is decided; each tail only
+        # visits its set bits that are still open (lowest bit first).
         n = self.table.num_columns
-        filled = [False] * n
+        pd = self.table.page_directory
+        get_page = self.table.pageBuffer.get_page
+        full = (1 << n) - 1
+        filled_mask = 0
         for i in range(rv_index, len(tails)):
             tr = tails[i]
-            pid_s, slot_s = self.table.page_directory[tr][config.SCHEMA_ENCODING_COLUMN]
-            bm = int(self.table.pageBuffer.get_page(pid_s).read(slot_s))
-            tvals = self._read_user_values_from_rid(tr)
-            for c in range(n):
-                if ((bm >> c) & 1) and not filled[c]:
-                    row[c] = tvals[c]
-                    filled[c] = True
-            if all(filled):
+            tlocs = pd[tr]
+            pid_s, slot_s = tlocs[_SCH]
+            to_apply = int(get_page(pid_s).read(slot_s)) & full & ~filled_mask
+            filled_mask |= to_apply
+            # read only the cells this tail contributes, not its whole user row
+            while to_apply:
+                low = to_apply & -to_apply
+                c = low.bit_length() - 1
+                pid, slot = tlocs[_META + c]
+                row[c] = get_page(pid).data[slot]
+                to_apply ^= low
+            if filled_mask == full:
                 break
-        return row
\ No newline at end of file
+        return row
@@ -1,11 +1,11 @@
 import time
 from . import config
-from .page import Page
+from .page import Page, read_page_file, write_page_file
 from .index import Index
 import os
-import json
 import threading
 import collections
+import array
 
 
 class Record:
@@ -15,6 +15,9 @@ class Record:
     Behaves list-like so external tests that compare a Record directly to a
     Python list/tuple (e.g., `if record != [ ... ]`) work as intended.
     """
+    # one Record per result row; fixed slots keep large result sets small
+    __slots__ = ("rid", "key", "columns")
+
     def __init__(self, rid, key, columns):
         self.rid = rid                 # base/tail RID (not used by testers)
         self.key = key                 # PK value (optional)
@@ -44,18 +47,6 @@ class Record:
             return False
 
 
-class IndirectionEntry:
-    """
-    Compatibility holder (not heavily used in A2).
-    Attributes:
-        pageType (int): 0 for base page, 1 for tail page.
-        rid (int|str): RID referred to by this entry.
-    """
-    def __init__(self, pageType: int, rid):
-        self.pageType = pageType  # 0 for base page, 1 for tail page
-        self.rid = rid
-
-
 class Table:
     """
     Column-store table with base/tail records and lazy recovery.
@@ -69,6 +60,7 @@ class Table:
         page_directory (dict): RID -> list[(page_id, slot)] of length META+user columns.
         base_record_count (int): Number of base records appended.
         tail_record_count (int): Number of tail records appended.
+        deleted (set[int]): Logically deleted base RIDs (always present).
         index (Index): Per-column secondary indexes (PK is built by default).
         pageBuffer (Bufferpool|None): Set by Database to perform I/O.
     """
@@ -81,12 +73,21 @@ class Table:
 
         # --- storage directory ---
         self.page_directory = {}                # RID -> [(page_id, slot)] for META+user cols
+        self._page_id_rows = {}                 # (page_no, is_base) -> page ids of every column
 
         # --- counters & state ---
         self.base_record_count = 0              # number of base rows ever appended
         self.tail_record_count = 0              # number of tail rows ever appended
         self.deleted = set()                    # base RIDs logically deleted this run
 
+        # --- tail lineage caches (built lazily from tail pages, then kept current by update_row) ---
+        self._prev_cache = {}                   # tail RID -> previous RID in its chain (0 = base)
+        self._ts_cache = {}                     # tail RID -> timestamp
+        self._head_cache = {}                   # base RID -> newest tail RID
+        self._root_cache = {}                   # tail RID -> base RID its chain ends at (0 if unknown)
+        self._tail_maps_built = False
+        self._latest_cache = {}                 # base RID -> (latest RID, its user values) after an update
+
         # --- indexing & bufferpool (linked by Database) ---
         self.index = Index(self)
         self.pageBuffer = None                  # set by Database.link_page_buffer / open()
@@ -147,11 +148,29 @@ class Table:
         """
         return f"{self.name}_{col_index}_{page_number}_{1 if is_base else 0}"
 
+    def _page_ids(self, page_number: int, is_base: bool):
+        """
+        Page ids of every physical column for one page number (memoized).
+
+        All columns of a row share the same page number, so page_directory
+        entries for rows on one page reuse these strings instead of formatting
+        a new id per cell.
+
+        Returns:
+            tuple[str, ...]: One page id per physical column (META+user).
+        """
+        key = (page_number, is_base)
+        pids = self._page_id_rows.get(key)
+        if pids is None:
+            pids = self._page_id_rows[key] = tuple(
+                self._page_id(c, page_number, is_base) for c in range(self._total_cols()))
+        return pids
+
     def _ts_millis(self):
         """
         Current wall-clock time in epoch milliseconds (for TIMESTAMP column).
         """
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000  # integer clock; no float multiply + truncate
 
     def _generate_rid(self, page_type):
         """
@@ -175,13 +194,8 @@ class Table:
             return base + self.tail_record_count
 
     def _is_base_rid(self, rid):
-        """Return True iff rid is a base RID (not a tail)."""
-        if isinstance(rid, str):
-            return rid.startswith('b')
-        try:
-            return int(rid) < getattr(config, "TAIL_RID_START", 10**9)
-        except Exception:
-            return False
+        """Return True iff rid is a base RID (not a tail). RIDs here are always ints."""
+        return rid < getattr(config, "TAIL_RID_START", 10**9)
 
     def _ensure_dir_entry(self, rid):
         """
@@ -211,6 +225,198 @@ class Table:
             # get_page does not pin; caller may pin/unpin if needed elsewhere
             pass
 
+    def _iter_base_blocks(self, col_index):
+        """
+        Walk one physical column of the base records page by page.
+
+        Base RIDs are issued sequentially and written in order, so base RID r
+        lives at slot r % MAX_RECORDS_PER_PAGE of page r // MAX_RECORDS_PER_PAGE
+        for every column. Each page's contiguous int64 buffer is one block of the
+        column.
+
+        Yields:
+            tuple[int, array.array, int]: (first_rid, data, count) per base page.
+        """
+        per_page = config.MAX_RECORDS_PER_PAGE
+        n_pages = (self.base_record_count + per_page - 1) // per_page
+        for page_number in range(n_pages):
+            page = self.pageBuffer.get_page(self._page_id(col_index, page_number, is_base=True))
+            yield page_number * per_page, page.data, page.num_records
+
+    def _iter_tail_blocks(self, col_index):
+        """
+        Walk one physical column of the tail records page by page.
+
+        Tails are appended in RID order like base rows, so tail page n holds
+        tail sequence numbers n*MAX_RECORDS_PER_PAGE onwards.
+
+        Yields:
+            tuple[int, array.array, int]: (first_rid, data, count) per tail page.
+        """
+        per_page = config.MAX_RECORDS_PER_PAGE
+        tail_start = getattr(config, "TAIL_RID_START", 10**9)
+        n_pages = (self.tail_record_count + per_page - 1) // per_page
+        for page_number in range(n_pages):
+            page = self.pageBuffer.get_page(self._page_id(col_index, page_number, is_base=False))
+            yield tail_start + page_number * per_page, page.data, page.num_records
+
+    def _scan_base_column_eq(self, col_index, value):
+        """
+        Return base RIDs whose stored base value in 'col_index' equals 'value'.
+
+        The comparison loop runs inside array.index() over each page block rather
+        than one page_directory lookup + Page.read() per cell. Only base values
+        are inspected (tails are not consulted), so this is exact for immutable
+        columns such as the primary key.
+
+        Args:
+            col_index (int): Physical column index (0..META+user-1).
+            value (int): Value to match.
+
+        Returns:
+            list[int]: Matching base RIDs in RID order (deleted rows included).
+        """
+        rids = []
+        for first_rid, data, count in self._iter_base_blocks(col_index):
+            i = 0
+            while True:
+                try:
+                    i = data.index(value, i, count)
+                except ValueError:
+                    break
+                rids.append(first_rid + i)
+                i += 1
+        return rids
+
+    def _scan_latest_column_eq(self, col_index, value):
+        """
+        Return base RIDs whose LATEST value in 'col_index' equals 'value'.
+
+        Pages with no updated rows (no INDIRECTION set) are matched entirely
+        inside array.index(), as in _scan_base_column_eq(). Pages with updates
+        fall back to a per-slot pass that reads the newest tail cell for
+        updated rows.
+
+        Args:
+            col_index (int): Physical column index (0..META+user-1).
+            value (int): Value to match.
+
+        Returns:
+            list[int]: Matching base RIDs in RID order (deleted rows included).
+        """
+        rids = []
+        indir_blocks = self._iter_base_blocks(config.INDIRECTION_COLUMN)
+        for (first_rid, data, count), (_, indir, _) in zip(self._iter_base_blocks(col_index), indir_blocks):
+            tails = indir[:count]
+            if tails.count(0) == count:
+                # untouched page: base values are the latest values
+                i = 0
+                while True:
+                    try:
+                        i = data.index(value, i, count)
+                    except ValueError:
+                        break
+                    rids.append(first_rid + i)
+                    i += 1
+                continue
+            for slot, tail_rid in enumerate(tails):
+                v = self._read_cell(tail_rid, col_index) if tail_rid else data[slot]
+                if v == value:
+                    rids.append(first_rid + slot)
+        return rids
+
+    def _column_latest_values(self, col_index):
+        """
+        Latest value of one physical column for every base RID, in one pass.
+
+        Reads the column's base blocks alongside the INDIRECTION blocks; rows
+        with no tail keep their base value, others take the cell from their
+        newest (cumulative) tail record.
+
+        Args:
+            col_index (int): Physical column index (0..META+user-1).
+
+        Returns:
+            tuple[list[int], list[int]]: (base_rids, values), parallel lists in
+            RID order (deleted rows included).
+        """
+        rids, vals = [], []
+        indir_blocks = self._iter_base_blocks(config.INDIRECTION_COLUMN)
+        for (first_rid, data, count), (_, indir, _) in zip(self._iter_base_blocks(col_index), indir_blocks):
+            rids.extend(range(first_rid, first_rid + count))
+            block = data[:count].tolist()
+            for slot, tail_rid in enumerate(indir[:count]):
+                if tail_rid:
+                    block[slot] = self._read_cell(tail_rid, col_index)
+            vals.extend(block)
+        return rids, vals
+
+    def _ensure_tail_maps(self):
+        """
+        Fill the tail lineage caches from the tail pages (first call only).
+
+        Tails appended after this are registered by update_row(), so the caches
+        stay current without being rebuilt. Chains recovered from disk end at 0
+        and do not name their base; those tails get a root of 0 and no head,
+        and readers use the base INDIRECTION cell instead.
+        """
+        if self._tail_maps_built:
+            return
+        with self._table_lock:
+            if self._tail_maps_built:
+                return
+            prev_cache, ts_cache = self._prev_cache, self._ts_cache
+
+            # one page fetch per tail block of the RID, INDIRECTION and
+            # TIMESTAMP columns, then plain slot reads
+            blocks = zip(self._iter_tail_blocks(config.RID_COLUMN),
+                         self._iter_tail_blocks(config.INDIRECTION_COLUMN),
+                         self._iter_tail_blocks(config.TIMESTAMP_COLUMN))
+            for (_, rids, count), (_, prevs, _), (_, stamps, _) in blocks:
+                for slot in range(count):
+                    rid = rids[slot]
+                    if rid not in prev_cache:  # already registered by update_row
+                        prev_cache[rid] = prevs[slot]
+                        ts_cache[rid] = stamps[slot]
+
+            # compute newest head per base (by timestamp, then RID)
+            root_cache, head_cache = self._root_cache, self._head_cache
+            for t in prev_cache:
+                # walk towards the base only until a tail with a known root is met,
+                # then record that root for every tail on the path (path compression)
+                path = []
+                cur = t
+                while cur in prev_cache and cur not in root_cache:
+                    path.append(cur)
+                    cur = prev_cache[cur]
+                base = root_cache.get(cur, cur)
+                for p in path:
+                    root_cache[p] = base
+                if not base:
+                    continue
+                cur_head = head_cache.get(base, 0)
+                if (not cur_head) or (ts_cache[t], t) > (ts_cache.get(cur_head, -1), cur_head):
+                    head_cache[base] = t
+            self._tail_maps_built = True
+
+    def _register_tail(self, tail_rid, prev_rid, ts, base_rid):
+        """
+        Record a freshly appended tail in the lineage caches.
+
+        Called by update_row() under the table lock; the new tail is by
+        construction the newest version of 'base_rid'.
+
+        Args:
+            tail_rid (int): RID of the new tail.
+            prev_rid (int): Previous RID in the chain (0 when it is the base).
+            ts (int): Tail timestamp.
+            base_rid (int): Base RID the chain belongs to.
+        """
+        self._prev_cache[tail_rid] = prev_rid
+        self._ts_cache[tail_rid] = ts
+        self._root_cache[tail_rid] = base_rid
+        self._head_cache[base_rid] = tail_rid
+
     def _write_indirection(self, base_rid, new_tail_rid):
         """
         Overwrite the base row's INDIRECTION cell with the latest tail RID.
@@ -236,23 +442,67 @@ class Table:
         indir = self._read_cell(base_rid, config.INDIRECTION_COLUMN)
         return base_rid if indir == 0 else indir
 
-    def _materialize_latest_user_values(self, base_rid):
+    def _materialize_latest_user_values(self, base_rid, projection=None):
         """
-        Build a full, user-columns-only view of the latest version.
+        Build a user-columns-only view of the latest version.
 
         Args:
             base_rid (int): Base RID whose latest values are requested.
+            projection (list[int] | None): Optional 1/0 mask over user columns;
+                masked-out columns are not read and come back as None.
 
         Returns:
-            list[int]: Values for all user columns, in user-column order.
+            list[int|None]: Values for the user columns, in user-column order.
         """
         latest = self._get_latest_rid(base_rid)
-        vals = []
-        for c in range(config.META_COLUMNS, config.META_COLUMNS + self.num_columns):
-            pid, slot = self.page_directory[latest][c]
-            page = self.pageBuffer.get_page(pid)
-            vals.append(page.read(slot))
-        return vals
+        locs = self.page_directory[latest][config.META_COLUMNS:config.META_COLUMNS + self.num_columns]
+        if projection is None or all(projection):
+            pages = self.pageBuffer.get_pages([pid for pid, _ in locs])
+            return [page.read(slot) for page, (_, slot) in zip(pages, locs)]
+        wanted = [loc for loc, keep in zip(locs, projection) if keep]
+        pages = iter(self.pageBuffer.get_pages([pid for pid, _ in wanted]))
+        return [next(pages).read(slot) if keep else None
+                for (_, slot), keep in zip(locs, projection)]
+
+    def _latest_user_rows(self, base_rids, projection=None):
+        """
+        Materialize the latest user rows for many base records, column at a time.
+
+        The INDIRECTION column is read first for all rows, then each projected
+        user column in turn. Consecutive rows usually share a page, so the page
+        is resolved once per run of rows instead of once per cell.
+
+        Args:
+            base_rids (list[int]): Base RIDs to materialize, in output order.
+            projection (list[int] | None): Optional 1/0 mask over user columns;
+                masked-out columns are not read and come back as None.
+
+        Returns:
+            list[list[int|None]]: One user-column row per base RID.
+        """
+        pd = self.page_directory
+        get_page = self.pageBuffer.get_page
+
+        def column(rids, col_index):
+            out = []
+            last_pid, data = None, None
+            for rid in rids:
+                pid, slot = pd[rid][col_index]
+                if pid != last_pid:
+                    last_pid, data = pid, get_page(pid).data
+                out.append(data[slot])
+            return out
+
+        indir = column(base_rids, config.INDIRECTION_COLUMN)
+        latest = [tail if tail else rid for rid, tail in zip(base_rids, indir)]
+        n = self.num_columns
+        rows = [[None] * n for _ in latest]
+        for c in range(n):
+            if projection is not None and not projection[c]:
+                continue
+            for row, v in zip(rows, column(latest, config.META_COLUMNS + c)):
+                row[c] = v
+        return rows
 
     # ---------- insert ----------
 
@@ -272,15 +522,11 @@ class Table:
             if pk_idx is not None and pk_val in pk_idx:
                 return False
 
-            # Fallback: scan base key cells (PK is immutable)
+            # Fallback: scan base key column blocks (PK is immutable)
             if pk_idx is None:
                 key_col = config.META_COLUMNS + self.key
-                for rid in self.page_directory.keys():
-                    if not self._is_base_rid(rid) or (rid in self.deleted):
-                        continue
-                    pid, slot = self.page_directory[rid][key_col]
-                    page = self.pageBuffer.get_page(pid)
-                    if page.read(slot) == pk_val:
+                for rid in self._scan_base_column_eq(key_col, pk_val):
+                    if rid not in self.deleted:
                         return False
 
             # Generate new base RID
@@ -303,6 +549,115 @@ class Table:
 
             return True
 
+    def insert_rows(self, rows):
+        """
+        Append many base records at once; all-or-nothing.
+
+        Rows are written page run by page run: each base page a batch touches
+        is fetched and pinned once per column and filled with one
+        Page.write_many() slice copy, instead of a get/pin/write/dirty/unpin
+        round per cell. The whole batch shares one timestamp.
+
+        Args:
+            rows (Iterable[Sequence[int]]): User-column values, one row each.
+
+        Returns:
+            bool: True if every row was inserted; False (nothing written) if a
+                  row has the wrong width, a value is not int-convertible (or
+                  outside int64), or a PK is duplicated.
+        """
+        rows = [tuple(r) for r in rows]
+        if not rows:
+            return True
+        with self._table_lock:  # M3: Protect concurrent inserts
+            user_cols = self.num_columns
+            if any(len(r) != user_cols for r in rows):
+                return False
+            # every user cell becomes an int64 before anything is checked or
+            # written, so a bad value rejects the batch with no page touched
+            try:
+                user_data = [array.array('q', c if all(type(v) is int for v in c) else map(int, c))
+                             for c in zip(*rows)]
+            except (TypeError, ValueError, OverflowError):
+                return False
+
+            # PK uniqueness: within the batch and against live base rows
+            keys = user_data[self.key].tolist()
+            if len(set(keys)) != len(keys):
+                return False
+            pk_idx = self.index.indices[self.key]
+            if pk_idx is not None:
+                if any(k in pk_idx for k in keys):
+                    return False
+            else:
+                wanted = set(keys)
+                key_col = config.META_COLUMNS + self.key
+                for first_rid, data, count in self._iter_base_blocks(key_col):
+                    for slot in range(count):
+                        if data[slot] in wanted and (first_rid + slot) not in self.deleted:
+                            return False
+
+            n = len(rows)
+            start = self.base_record_count
+            timestamp = self._ts_millis()
+            # one value list per physical column: INDIRECTION, RID, TIMESTAMP, SCHEMA, users
+            cols = [[0] * n, list(range(start, start + n)), [timestamp] * n, [0] * n]
+            cols.extend(user_data)
+
+            self._append_columns(start, start, True, cols)
+            self.base_record_count += n
+
+            # Update indices (PK and any others)
+            for col_index in range(user_cols):
+                if self.index.indices[col_index] is not None:
+                    for i, value in enumerate(user_data[col_index]):
+                        self.index.insert_entry(start + i, col_index, value)
+
+            return True
+
+    def _append_columns(self, first_seq, first_rid, is_base, cols):
+        """
+        Append a run of records, given column-wise, page run by page run.
+
+        Each page the run touches is fetched and pinned once per column and
+        filled with one Page.write_many() slice copy. Shared by insert_rows()
+        (base pages) and update_rows() (tail pages); callers hold the table
+        lock, pass values already validated as int64 and advance the record
+        counter afterwards. Pages are unpinned even if a write raises.
+
+        Args:
+            first_seq (int): Sequence number of the first record in its space
+                             (base_record_count or tail_record_count).
+            first_rid (int): RID of the first record; the rest are consecutive.
+            is_base (bool): True for base pages, False for tail pages.
+            cols (list[list[int]]): One value list per physical column.
+        """
+        n = len(cols[0])
+        per_page = config.MAX_RECORDS_PER_PAGE
+        pb = self.pageBuffer
+        pd = self.page_directory
+        pos = 0
+        while pos < n:
+            page_number, first_slot = divmod(first_seq + pos, per_page)
+            chunk = min(n - pos, per_page - first_slot)
+            page_ids = self._page_ids(page_number, is_base)
+            pages = pb.get_pages(page_ids)
+            for page_id in page_ids:
+                pb.pin_page(page_id)
+            try:
+                slots = []
+                for c, page in enumerate(pages):
+                    slots.append(page.num_records)
+                    page.write_many(cols[c][pos:pos + chunk])
+                for page_id in page_ids:
+                    pb.mark_dirty(page_id)
+            finally:
+                for page_id in page_ids:
+                    pb.unpin_page(page_id)
+            for i in range(chunk):
+                pd[first_rid + pos + i] = [(page_id, s0 + i) for page_id, s0 in zip(page_ids, slots)]
+            pos += chunk
+
     def _write_to_base_pages(self, rid, full_record):
         """
         Physically append the record to base pages (META+user columns).
@@ -315,18 +670,44 @@ class Table:
             full_record (list[int]): META columns + user columns.
         """
         page_number = self.base_record_count // config.MAX_RECORDS_PER_PAGE
-        self._ensure_dir_entry(rid)
-        # Write all meta+user columns
-        for col_index in range(self._total_cols()):
-            page_id = self._page_id(col_index, page_number, is_base=True)
-            page = self.pageBuffer.get_page(page_id)
-            self.pageBuffer.pin_page(page_id)
-            slot = page.write(full_record[col_index])
-            self.pageBuffer.mark_dirty(page_id)
-            self.pageBuffer.unpin_page(page_id)
-            self.page_directory[rid][col_index] = (page_id, slot)
+        self.page_directory[rid] = self._write_row(self._page_ids(page_number, True), full_record)
         self.base_record_count += 1
 
+    def _write_row(self, page_ids, full_record):
+        """
+        Append one value per physical column and return where each landed.
+
+        The whole record is converted to int64 cells before any page is
+        touched, so a value int() rejects (or one out of int64 range) fails
+        the row with nothing written. All column pages of the row are then
+        resolved with a single Bufferpool.get_pages() call and pinned together
+        while the values are written; they are always unpinned afterwards.
+
+        Args:
+            page_ids (tuple[str, ...]): Page id per physical column.
+            full_record (list[int]): META columns + user columns.
+
+        Returns:
+            list[tuple[str, int]]: page_directory row of (page_id, slot) pairs.
+
+        Raises:
+            TypeError, ValueError, OverflowError: If a value is not an int64.
+        """
+        cells = array.array('q', full_record if all(type(v) is int for v in full_record)
+                            else map(int, full_record))
+        pb = self.pageBuffer
+        pages = pb.get_pages(page_ids)
+        for page_id in page_ids:
+            pb.pin_page(page_id)
+        try:
+            entry = [(page_id, page.write(v)) for page_id, page, v in zip(page_ids, pages, cells)]
+            for page_id in page_ids:
+                pb.mark_dirty(page_id)
+        finally:
+            for page_id in page_ids:
+                pb.unpin_page(page_id)
+        return entry
+
     def _write_to_tail_pages(self, tail_rid, full_record):
         """
         Physically append a tail snapshot across all columns.
@@ -336,50 +717,64 @@ class Table:
             full_record (list[int]): META columns + user columns (cumulative).
         """
         page_number = self.tail_record_count // config.MAX_RECORDS_PER_PAGE
-        self._ensure_dir_entry(tail_rid)
-        for col_index in range(self._total_cols()):
-            page_id = self._page_id(col_index, page_number, is_base=False)
-            page = self.pageBuffer.get_page(page_id)
-            self.pageBuffer.pin_page(page_id)
-            slot = page.write(full_record[col_index])
-            self.pageBuffer.mark_dirty(page_id)
-            self.pageBuffer.unpin_page(page_id)
-            self.page_directory[tail_rid][col_index] = (page_id, slot)
+        self.page_directory[tail_rid] = self._write_row(self._page_ids(page_number, False), full_record)
         self.tail_record_count += 1
 
+    def _latest_state(self, base_rid):
+        """
+        Locate a base row's indirection cell and materialize its latest values.
+
+        Reads one directory row per RID and fetches all user-column pages in
+        one get_pages call; skips the page reads entirely when _latest_cache
+        still holds the current head.
+
+        Args:
+            base_rid (int): Base RID to resolve.
+
+        Returns:
+            tuple | None: (ind_pid, ind_slot, latest_rid, current_values), or
+                          None if 'base_rid' is unknown.
+        """
+        pd = self.page_directory
+        base_locs = pd.get(base_rid)
+        if base_locs is None:
+            return None
+        # Base's INDIRECTION points to latest tail (0 if none).
+        ind_pid, ind_slot = base_locs[config.INDIRECTION_COLUMN]
+        latest = self.pageBuffer.get_page(ind_pid).read(ind_slot)
+        latest_rid = base_rid if latest in (0, None) else latest
+        cached = self._latest_cache.get(base_rid)
+        if cached is not None and cached[0] == latest_rid:
+            # this row was updated earlier and the head has not moved
+            # since: its values are known without reading any pages
+            return ind_pid, ind_slot, latest_rid, cached[1]
+        locs = pd[latest_rid][config.META_COLUMNS:config.META_COLUMNS + self.num_columns]
+        current = [page.read(slot) for page, (_, slot)
+                   in zip(self.pageBuffer.get_pages([pid for pid, _ in locs]), locs)]
+        return ind_pid, ind_slot, latest_rid, current
+
     # ---------- update (cumulative tail snapshot) ----------
 
     def update_row(self, base_rid, *columns):
         """
         Write a cumulative tail record for `base_rid`.
         `columns` is a full user-length vector where None means "no change".
-        Returns True on success; False on any contract violation.
+        Returns True on success; False on any contract violation (including a
+        tail or deleted RID).
         """
         with self._table_lock:  # M3: Protect concurrent updates
             try:
                 user_cols = self.num_columns
                 if len(columns) != user_cols:
                     return False
-                if base_rid not in self.page_directory:
+                # only live base rows take updates; a tail RID is in the
+                # directory too, but "updating" it would clobber its chain link
+                if not self._is_base_rid(base_rid) or base_rid in self.deleted:
                     return False
-
-                # ---- helpers (local) ----
-                def _read_user_values_for_rid(rid):
-                    vals = []
-                    for i in range(user_cols):
-                        pid, slot = self.page_directory[rid][4 + i]
-                        vals.append(self.pageBuffer.get_page(pid).read(slot))
-                    return vals
-
-                def _latest_rid_for_base(rid0):
-                    # Base's INDIRECTION points to latest tail (0 if none).
-                    pid, slot = self.page_directory[rid0][config.INDIRECTION_COLUMN]
-                    latest = self.pageBuffer.get_page(pid).read(slot)
-                    return rid0 if (latest in (0, None)) else latest
-
-                # ---- materialize current latest ----
-                latest_rid = _latest_rid_for_base(base_rid)
-                current = _read_user_values_for_rid(latest_rid)
+                state = self._latest_state(base_rid)
+                if state is None:
+                    return False
+                ind_pid, ind_slot, latest_rid, current = state
 
                 # ---- fill new values + build bitmask (int) ----
                 new_vals = list(current)
@@ -394,22 +789,112 @@ class Table:
 
                 # ---- craft the tail record (cumulative) ----
                 new_tail_rid = self._generate_rid("tail")
-                ts = int(time.time() * 1000)
+                ts = self._ts_millis()
                 prev_ptr = latest_rid if latest_rid != base_rid else 0  # 0 signals base
 
                 full_tail = [prev_ptr, new_tail_rid, ts, bitmask] + new_vals
                 self._write_to_tail_pages(new_tail_rid, full_tail)
+                self._register_tail(new_tail_rid, prev_ptr, ts, base_rid)
+                self._latest_cache[base_rid] = (new_tail_rid, new_vals)
 
                 # ---- bump base indirection to the NEW tail (in place) ----
-                pid, slot = self.page_directory[base_rid][config.INDIRECTION_COLUMN]
-                page = self.pageBuffer.get_page(pid)
-                page.write_at(slot, new_tail_rid)
-                self.pageBuffer.mark_dirty(pid)
+                # re-fetch by id: the tail writes above may have evicted the frame
+                self.pageBuffer.get_page(ind_pid).write_at(ind_slot, new_tail_rid)
+                self.pageBuffer.mark_dirty(ind_pid)
 
                 return True
             except Exception:
                 return False
 
+    def update_rows(self, updates):
+        """
+        Apply many updates at once, appending their tails as one sorted run.
+
+        Updates are ordered by base RID (stable, so repeated updates of one row
+        keep their order and chain onto each other) and each new tail is built
+        in memory; the whole run is then written column-wise with
+        _append_columns(), the same page-run bulk path insert_rows() uses,
+        instead of one tail write round per update. Nothing is deferred: every
+        tail is in the buffer pool and linked into its chain when this returns,
+        so versioned reads and recovery see what the same update_row() calls
+        would have produced. The whole batch shares one timestamp.
+
+        Args:
+            updates (Iterable[tuple[int, Sequence]]): (base_rid, columns) pairs;
+                'columns' follows update_row(): full user width, None = no change.
+
+        Returns:
+            bool: True if every update was applied; False (nothing written) if
+                  any entry is malformed, has the wrong width, a value that is
+                  not int-convertible (or outside int64), or a RID that is not
+                  a live base RID (unknown, a tail RID, or deleted).
+        """
+        # RIDs and new values become ints up front, so a malformed entry
+        # rejects the batch before anything is read or written
+        try:
+            normalized = []
+            for r, c in updates:
+                c = tuple(v if v is None or type(v) is int else int(v) for v in c)
+                array.array('q', [v for v in c if v is not None])  # int64 range check
+                normalized.append((int(r), c))
+        except (TypeError, ValueError, OverflowError):
+            return False
+        updates = sorted(normalized, key=lambda u: u[0])
+        if not updates:
+            return True
+        with self._table_lock:  # M3: Protect concurrent updates
+            user_cols = self.num_columns
+            pd = self.page_directory
+            tail_start = getattr(config, "TAIL_RID_START", 10**9)
+            deleted = self.deleted
+            # only live base rows: a tail RID is in the directory too
+            if any(len(c) != user_cols or r not in pd or r >= tail_start or r in deleted
+                   for r, c in updates):
+                return False
+
+            ts = self._ts_millis()
+            start = self.tail_record_count
+            tail_rid = self._generate_rid("tail")
+            states = {}   # base_rid -> [ind_pid, ind_slot, latest_rid, values]
+            tails = []    # (base_rid, full tail record)
+            for base_rid, columns in updates:
+                state = states.get(base_rid)
+                if state is None:
+                    state = states[base_rid] = list(self._latest_state(base_rid))
+                current = state[3]
+                new_vals = list(current)
+                bitmask = 0
+                for i, v in enumerate(columns):
+                    if v is not None and v != current[i]:
+                        new_vals[i] = v
+                        bitmask |= (1 << i)
+                if bitmask == 0:
+                    continue  # no-op update
+                prev_ptr = state[2] if state[2] != base_rid else 0  # 0 signals base
+                tails.append((base_rid, [prev_ptr, tail_rid, ts, bitmask] + new_vals))
+                state[2] = tail_rid
+                state[3] = new_vals
+                tail_rid += 1
+            if not tails:
+                return True
+
+            # ---- one column-wise bulk append for the whole run ----
+            cols = [list(c) for c in zip(*(t for _, t in tails))]
+            self._append_columns(start, cols[config.RID_COLUMN][0], False, cols)
+            self.tail_record_count += len(tails)
+            for base_rid, full_tail in tails:
+                self._register_tail(full_tail[config.RID_COLUMN], full_tail[config.INDIRECTION_COLUMN], ts, base_rid)
+
+            # ---- bump each touched base's indirection to its newest tail ----
+            pb = self.pageBuffer
+            for base_rid, (ind_pid, ind_slot, head_rid, values) in states.items():
+                if head_rid == base_rid:
+                    continue
+                pb.get_page(ind_pid).write_at(ind_slot, head_rid)
+                pb.mark_dirty(ind_pid)
+                self._latest_cache[base_rid] = (head_rid, values)
+            return True
+
     # ---------- buffer hooks for Bufferpool ----------
 
     def get_page(self, page_id):
@@ -425,14 +910,10 @@ class Table:
         # honor DATA_DIR and file suffix
         dir_path = os.path.join(config.DATA_DIR, self.name)
         os.makedirs(dir_path, exist_ok=True)
-        page_path = os.path.join(dir_path, f"{page_id}{getattr(config, 'PAGE_FILE_SUFFIX', '.page.json')}")
-        if not os.path.exists(page_path):
+        page = read_page_file(os.path.join(dir_path, page_id))
+        if page is None:
             return Page()  # Return an empty page if it doesn't exist
-        with open(page_path, 'r') as f:
-            page_data = json.load(f)
-            page = Page()
-            page.fromJSON(page_data)
-            return page
+        return page
 
     def write_page(self, page_id, page):
         '''
@@ -444,9 +925,7 @@ class Table:
         '''
         dir_path = os.path.join(config.DATA_DIR, self.name)
         os.makedirs(dir_path, exist_ok=True)
-        page_path = os.path.join(dir_path, f"{page_id}{getattr(config, 'PAGE_FILE_SUFFIX', '.page.json')}")
-        with open(page_path, 'w') as f:
-            json.dump(page.toJSON(), f)
+        write_page_file(os.path.join(dir_path, page_id), page)
 
     def recover(self):
         """
@@ -454,7 +933,7 @@ class Table:
         from pages stored on disk under DATA_DIR/<table>/.
 
         Assumes underscore page-id:
-            <table>_<col>_<pageNo>_<isBase(0|1)> + PAGE_FILE_SUFFIX
+            <table>_<col>_<pageNo>_<isBase(0|1)> + PAGE_FILE_SUFFIX (or the legacy JSON suffix)
 
         Strategy:
             1) Scan only RID-column pages to enumerate RIDs and slots per page.
@@ -464,7 +943,8 @@ class Table:
             4) Rebuild the primary-key index.
         """
         dir_path = os.path.join(config.DATA_DIR, self.name)
-        suffix = getattr(config, "PAGE_FILE_SUFFIX", ".page.json")
+        suffixes = (getattr(config, "PAGE_FILE_SUFFIX", ".page"),
+                    getattr(config, "LEGACY_PAGE_FILE_SUFFIX", ".page.json"))
 
         if not os.path.isdir(dir_path):
             # nothing persisted yet
@@ -478,15 +958,23 @@ class Table:
         self.page_directory = {}
         self.base_record_count = 0
         self.tail_record_count = 0
-        total_cols = config.META_COLUMNS + self.num_columns
+        self._prev_cache, self._ts_cache = {}, {}
+        self._head_cache, self._root_cache = {}, {}
+        self._tail_maps_built = False
+        self._latest_cache = {}
         tail_start = getattr(config, "TAIL_RID_START", 10**9)
         max_tail_seq = -1   # for next tail rid calc
 
         # First pass: scan RID-column pages (meta col = config.RID_COLUMN) for base and tail
+        seen = set()
         for fname in os.listdir(dir_path):
-            if not fname.endswith(suffix):
+            suffix = next((sfx for sfx in suffixes if fname.endswith(sfx)), None)
+            if suffix is None:
                 continue
             page_id = fname[: -len(suffix)]
+            if page_id in seen:
+                continue  # binary and legacy copies of one page: read once
+            seen.add(page_id)
             parts = page_id.split('_')
             if len(parts) != 4:
                 continue
@@ -502,25 +990,18 @@ class Table:
             if col_index != config.RID_COLUMN:
                 continue
 
-            # Load the RID page
-            with open(os.path.join(dir_path, fname), "r") as f:
-                obj = json.load(f)
-            p = Page()
-            p.fromJSON(obj)
+            # Load the RID page (binary preferred over a legacy JSON copy)
+            p = read_page_file(os.path.join(dir_path, page_id))
 
             # For each slot with a RID, bind ALL columns at the same slot on that page_no
+            pids = self._page_ids(page_no, is_base)
             for slot in range(p.num_records):
                 try:
                     rid_val = int(p.read(slot))
                 except Exception:
                     continue
 
-                if rid_val not in self.page_directory:
-                    self.page_directory[rid_val] = [None] * total_cols
-
-                for c in range(total_cols):
-                    pid_c = f"{self.name}_{c}_{page_no}_{1 if is_base else 0}"
-                    self.page_directory[rid_val][c] = (pid_c, slot)
+                self.page_directory[rid_val] = [(pid_c, slot) for pid_c in pids]
 
                 if is_base:
                     # base RIDs are 0..N-1; keep next-id as max+1
@@ -539,8 +1020,11 @@ class Table:
 
     def merge(self):
         """Lazy close-time merge of latest values back into base rows."""
-        for rid in list(self.page_directory.keys()):
-            if not self._is_base_rid(rid) or (rid in self.deleted):
+        # base RIDs are dense (0..base_record_count-1), so no directory walk or
+        # base/tail classification is needed to enumerate them
+        deleted = self.deleted
+        for rid in range(self.base_record_count):
+            if rid in deleted:
                 continue
             latest_vals = self._materialize_latest_user_values(rid)
 
@@ -553,7 +1037,8 @@ class Table:
                 self.pageBuffer.mark_dirty(pid)
                 self.pageBuffer.unpin_page(pid)
 
-            # reset indirection and schema on base row
+            # reset indirection and schema on base row; the base no longer has a head
+            self._head_cache.pop(rid, None)
             pid, slot = self.page_directory[rid][config.INDIRECTION_COLUMN]
             page = self.pageBuffer.get_page(pid)
             self.pageBuffer.pin_page(pid); page.data[slot] = 0
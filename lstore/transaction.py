@@ -83,6 +83,23 @@ class Transaction:
         """Roll back all operations of this transaction."""
         from lstore import config
         
+        # Roll back delete first: update_row() refuses deleted rows, so a row
+        # this transaction updated and then deleted must be live again below
+        for table, rid in self.deleted_rids:
+            if rid in table.deleted:
+                table.deleted.remove(rid)
+                # Restore to PK index
+                try:
+                    if rid in table.page_directory:
+                        key_col = config.META_COLUMNS + table.key
+                        pid, slot = table.page_directory[rid][key_col]
+                        page = table.pageBuffer.get_page(pid)
+                        pk_value = page.read(slot)
+                        if table.index.indices[table.key] is not None:
+                            table.index.indices[table.key][pk_value] = [rid]  # PK postings are singleton lists
+                except:
+                    pass
+        
         # Roll back updates
         for entry in self.updated_rids:
             if len(entry) == 4:
@@ -103,8 +120,6 @@ class Transaction:
         
         # Roll back inserts
         for table, rid in self.inserted_rids:
-            if not hasattr(table, 'deleted'):
-                table.deleted = set()
             table.deleted.add(rid)
             # Remove from PK index
             try:
@@ -119,22 +134,6 @@ class Transaction:
             except:
                 pass
         
-        # Roll back delete
-        for table, rid in self.deleted_rids:
-            if hasattr(table, 'deleted') and rid in table.deleted:
-                table.deleted.remove(rid)
-                # Restore to PK index
-                try:
-                    if rid in table.page_directory:
-                        key_col = config.META_COLUMNS + table.key
-                        pid, slot = table.page_directory[rid][key_col]
-                        page = table.pageBuffer.get_page(pid)
-                        pk_value = page.read(slot)
-                        if table.index.indices[table.key] is not None:
-                            table.index.indices[table.key][pk_value] = rid
-                except:
-                    pass
-        
         # Release all locks held by this transaction
         self.lock_manager.release_all(self.txn_id)
         return False